@@ -29,3 +29,5 @@ GANTT_MONTH_WIDTH = 6
 
 # UI
 SPLITTER_DEFAULT_RATIO = [400, 600]
+# Set BOKMAL_RAW_QSS=1 to apply the stylesheets unminified, e.g. when debugging QSS
+QSS_RAW = os.environ.get("BOKMAL_RAW_QSS") == "1"
@@ -1,11 +1,74 @@
 """Scheduling Engine - CPM (Critical Path Method) implementation."""
 
 from datetime import date, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from engine.date_utils import add_working_days, count_working_days
 
 
+def topological_order(tasks: list, succs: dict) -> list[int]:
+    """Order schedulable task ids so every predecessor precedes its successors.
+
+    Uses Kahn's algorithm over the non-summary tasks and everything reachable
+    from them, in O(V + E) without recursion. If a dependency cycle stalls the
+    queue, the remaining tasks are ordered by an iterative depth-first search
+    so the cycle and everything downstream of it still follow their
+    predecessors.
+    """
+    # Collect the nodes to order: non-summary tasks plus their successors
+    nodes: list[int] = []
+    seen: set[int] = set()
+    stack = [t.id for t in reversed(tasks) if not t.is_summary]
+    while stack:
+        tid = stack.pop()
+        if tid in seen:
+            continue
+        seen.add(tid)
+        nodes.append(tid)
+        stack.extend(s.id for s, _, _ in succs.get(tid, ()))
+    position = {t.id: i for i, t in enumerate(tasks)}
+    nodes.sort(key=position.__getitem__)
+
+    in_degree = dict.fromkeys(nodes, 0)
+    for tid in nodes:
+        for succ_task, _, _ in succs.get(tid, ()):
+            in_degree[succ_task.id] += 1
+
+    queue = deque(tid for tid in nodes if in_degree[tid] == 0)
+    order: list[int] = []
+    while queue:
+        tid = queue.popleft()
+        order.append(tid)
+        for succ_task, _, _ in succs.get(tid, ()):
+            sid = succ_task.id
+            in_degree[sid] -= 1
+            if in_degree[sid] == 0:
+                queue.append(sid)
+
+    if len(order) < len(nodes):
+        # The queue stalled on a cycle. Order what is left by reverse DFS
+        # postorder, which keeps each cycle ahead of the tasks depending on it.
+        visited = set(order)
+        postorder: list[int] = []
+        for root in nodes:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(succs.get(root, ())))]
+            while stack:
+                tid, it = stack[-1]
+                for succ_task, _, _ in it:
+                    if succ_task.id not in visited:
+                        visited.add(succ_task.id)
+                        stack.append((succ_task.id, iter(succs.get(succ_task.id, ()))))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(tid)
+        order.extend(reversed(postorder))
+    return order
+
+
 class Scheduler:
     """Schedule calculator using Critical Path Method."""
 
@@ -43,23 +106,7 @@ class Scheduler:
                 succs[dep.predecessor_id].append((succ_task, dep.dep_type, dep.lag))
 
         # --- Forward Pass ---
-        # Topological sort
-        visited = set()
-        topo_order = []
-
-        def visit(task_id):
-            if task_id in visited:
-                return
-            visited.add(task_id)
-            for succ_task, _, _ in succs.get(task_id, []):
-                visit(succ_task.id)
-            topo_order.append(task_id)
-
-        for t in tasks:
-            if not t.is_summary:
-                visit(t.id)
-
-        topo_order.reverse()
+        topo_order = topological_order(tasks, succs)
 
         # Early start/finish
         early_start: dict[int, date] = {}
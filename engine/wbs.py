@@ -5,15 +5,22 @@ class WBSManager:
     """Manages WBS hierarchy: indent, outdent, numbering."""
 
     @staticmethod
-    def recalculate_wbs(tasks: list) -> None:
+    def recalculate_wbs(tasks: list, start_index: int = 0) -> None:
         """Recalculate WBS numbers for all tasks in order.
 
         Tasks must be sorted by sort_order.
         Each task has wbs_level (0 = top level).
+        With start_index > 0, numbering resumes from the WBS code of the task
+        just before it; tasks above start_index must be unchanged.
         """
         counters: list[int] = []
+        if start_index > 0:
+            try:
+                counters = [int(p) for p in tasks[start_index - 1].wbs.split(".")]
+            except (AttributeError, ValueError):
+                start_index = 0  # previous code unusable: renumber everything
 
-        for task in tasks:
+        for task in tasks[start_index:]:
             level = task.wbs_level
 
             # Ensure counters list is long enough
@@ -31,20 +38,50 @@ class WBSManager:
             task.wbs = ".".join(str(counters[i]) for i in range(level + 1))
 
     @staticmethod
-    def update_summary_flags(tasks: list) -> None:
+    def update_summary_flags(tasks: list, start_index: int = 0) -> None:
         """Mark tasks as summary if they have children (next task has higher level)."""
-        for i, task in enumerate(tasks):
+        # The task before start_index may gain or lose its first child
+        for i in range(max(0, start_index - 1), len(tasks)):
+            task = tasks[i]
             if i + 1 < len(tasks) and tasks[i + 1].wbs_level > task.wbs_level:
                 task.is_summary = True
             else:
                 task.is_summary = False
 
     @staticmethod
-    def update_parent_ids(tasks: list) -> None:
+    def _parent_stack_before(tasks: list, start_index: int) -> list[int | None]:
+        """Rebuild update_parent_ids' parent stack as it is before start_index.
+
+        Entry k holds the nearest preceding task at level k - 1 not followed by
+        a shallower task; level gaps repeat the entry below, as the forward
+        pass does.
+        """
+        if start_index <= 0:
+            return [None]
+        prev_level = tasks[start_index - 1].wbs_level
+        stack: list[int | None] = [None] * (prev_level + 2)
+        found: list[bool] = [True] + [False] * (prev_level + 1)
+        min_level = prev_level + 1
+        for i in range(start_index - 1, -1, -1):
+            level = tasks[i].wbs_level
+            if level < min_level:
+                stack[level + 1] = tasks[i].id
+                found[level + 1] = True
+                min_level = level
+                if level == 0:
+                    break
+        for k in range(1, len(stack)):
+            if not found[k]:
+                stack[k] = stack[k - 1]
+        return stack
+
+    @staticmethod
+    def update_parent_ids(tasks: list, start_index: int = 0) -> None:
         """Set parent_id based on WBS levels."""
-        parent_stack: list[int | None] = [None]  # stack of parent task ids
+        # stack of parent task ids
+        parent_stack: list[int | None] = WBSManager._parent_stack_before(tasks, start_index)
 
-        for task in tasks:
+        for task in tasks[start_index:]:
             level = task.wbs_level
 
             # Adjust stack to current level
@@ -108,8 +145,12 @@ class WBSManager:
         return True
 
     @staticmethod
-    def recalculate_all(tasks: list) -> None:
-        """Full recalculation of WBS numbers, parent IDs, and summary flags."""
-        WBSManager.recalculate_wbs(tasks)
-        WBSManager.update_summary_flags(tasks)
-        WBSManager.update_parent_ids(tasks)
+    def recalculate_all(tasks: list, start_index: int = 0) -> None:
+        """Recalculation of WBS numbers, parent IDs, and summary flags.
+
+        Tasks before start_index are assumed unchanged since the last
+        recalculation; only the remainder of the list is renumbered.
+        """
+        WBSManager.recalculate_wbs(tasks, start_index)
+        WBSManager.update_summary_flags(tasks, start_index)
+        WBSManager.update_parent_ids(tasks, start_index)
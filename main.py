@@ -15,7 +15,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from ui.main_window import MainWindow
-from ui.theme import get_theme_stylesheet
+from ui.theme import apply_theme
 from config import APP_TITLE
 
 
@@ -36,7 +36,7 @@ def main():
     app.setFont(font)
 
     # Apply dark theme
-    app.setStyleSheet(get_theme_stylesheet())
+    apply_theme(app, "dark")
 
     # Create and show main window
     window = MainWindow()
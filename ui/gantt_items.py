@@ -9,7 +9,7 @@ from PySide6.QtGui import (
     QPolygonF, QFont, QPainterPath
 )
 
-from ui.theme import COLORS
+from ui.theme import qcolor
 from config import GANTT_ROW_HEIGHT
 
 
@@ -86,7 +86,7 @@ class TaskBarItem(QGraphicsItem):
 
         # Selection highlight
         if self.isSelected():
-            painter.setPen(QPen(QColor(COLORS["accent"]), 2))
+            painter.setPen(QPen(qcolor("accent"), 2))
             painter.setBrush(Qt.BrushStyle.NoBrush)
             rect = QRectF(0, y_offset, self.bar_width, self.bar_height)
             painter.drawRoundedRect(rect, 3, 3)
@@ -97,14 +97,14 @@ class TaskBarItem(QGraphicsItem):
         # Gradient fill
         gradient = QLinearGradient(0, y_offset, 0, y_offset + self.bar_height)
         if is_critical:
-            gradient.setColorAt(0, QColor(COLORS["critical"]))
-            gradient.setColorAt(1, QColor(COLORS["critical_dark"]))
+            gradient.setColorAt(0, qcolor("critical"))
+            gradient.setColorAt(1, qcolor("critical_dark"))
         else:
-            gradient.setColorAt(0, QColor(COLORS["accent"]))
-            gradient.setColorAt(1, QColor(COLORS["accent_gradient_start"]))
+            gradient.setColorAt(0, qcolor("accent"))
+            gradient.setColorAt(1, qcolor("accent_gradient_start"))
 
         if self._hovered:
-            gradient.setColorAt(0, QColor(COLORS["accent_light"]))
+            gradient.setColorAt(0, qcolor("accent_light"))
 
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(gradient))
@@ -114,7 +114,7 @@ class TaskBarItem(QGraphicsItem):
         if progress > 0:
             prog_width = self.bar_width * progress
             prog_rect = QRectF(0, y_offset, prog_width, self.bar_height)
-            painter.setBrush(QColor(COLORS["progress"]).darker(130))
+            painter.setBrush(qcolor("progress").darker(130))
             painter.setOpacity(0.4)
             painter.drawRoundedRect(prog_rect, 4, 4)
             painter.setOpacity(1.0)
@@ -143,7 +143,7 @@ class TaskBarItem(QGraphicsItem):
 
         # Main bar
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(COLORS["summary_bar"]))
+        painter.setBrush(qcolor("summary_bar"))
         painter.drawRect(QRectF(0, y, self.bar_width, bar_h))
 
         # Left bracket
@@ -166,7 +166,7 @@ class TaskBarItem(QGraphicsItem):
         # Task name text
         name = self.task_data.get("name", "")
         if name:
-            painter.setPen(QColor(COLORS.get("text_primary", "#e0e0e8")))
+            painter.setPen(qcolor("text_primary"))
             f = QFont("Segoe UI", 9)
             painter.setFont(f)
             text_rect = QRectF(self.bar_width + 8, y_offset, 340, self.bar_height)
@@ -188,7 +188,7 @@ class TaskBarItem(QGraphicsItem):
         ])
 
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(COLORS["milestone"]))
+        painter.setBrush(qcolor("milestone"))
         painter.drawPolygon(diamond)
 
         if self._hovered:
@@ -286,7 +286,8 @@ class DependencyArrowItem(QGraphicsItem):
         self.start_point = start_point
         self.end_point = end_point
         self.dep_type = dep_type
-        self._color = QColor(COLORS["dependency_arrow"])
+        self.dep: dict | None = None  # source dependency dict, set by the chart
+        self._color = qcolor("dependency_arrow")
         self._arrow_size = 6
 
     def boundingRect(self) -> QRectF:
@@ -357,7 +358,7 @@ class TodayLineItem(QGraphicsItem):
 
     def paint(self, painter: QPainter, option, widget=None):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        pen = QPen(QColor(COLORS["today_line"]), 2, Qt.PenStyle.DashLine)
+        pen = QPen(qcolor("today_line"), 2, Qt.PenStyle.DashLine)
         painter.setPen(pen)
         painter.drawLine(
             QPointF(self.line_x, 0),
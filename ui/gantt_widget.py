@@ -9,10 +9,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QRectF, QPointF, Signal, QDateTime
 from PySide6.QtGui import (
-    QPainter, QColor, QBrush, QPen, QFont, QWheelEvent, QLinearGradient
+    QPainter, QBrush, QPen, QFont, QWheelEvent, QLinearGradient
 )
 
-from ui.theme import COLORS
+from ui.theme import COLORS, qcolor
 from ui.gantt_items import TaskBarItem, DependencyArrowItem, TodayLineItem, InazumaLineItem
 from config import GANTT_ROW_HEIGHT, GANTT_HEADER_HEIGHT, GANTT_DAY_WIDTH
 
@@ -71,7 +71,7 @@ class GanttScene(QGraphicsScene):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
 
         # Background fill
-        painter.fillRect(rect, QColor(COLORS["gantt_bg"]))
+        painter.fillRect(rect, qcolor("gantt_bg"))
 
         total_days = (self.project_end - self.project_start).days + 1
         total_width = total_days * self.day_width
@@ -85,14 +85,14 @@ class GanttScene(QGraphicsScene):
 
         # --- Header background ---
         header_rect = QRectF(rect.left(), 0, rect.width(), self.header_height)
-        painter.fillRect(header_rect, QColor(COLORS["gantt_header_bg"]))
+        painter.fillRect(header_rect, qcolor("gantt_header_bg"))
 
         # --- Draw day columns ---
         start_day = max(0, int(left / self.day_width))
         end_day = min(total_days, int(right / self.day_width) + 1)
 
-        grid_pen = QPen(QColor(COLORS["grid_line"]), 0.5)
-        weekend_brush = QBrush(QColor(COLORS["weekend_bg"]))
+        grid_pen = QPen(qcolor("grid_line"), 0.5)
+        weekend_brush = QBrush(qcolor("weekend_bg"))
         header_font = QFont("Segoe UI", 9)
         header_font_small = QFont("Segoe UI", 7)
         month_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
@@ -121,7 +121,7 @@ class GanttScene(QGraphicsScene):
                 painter.drawLine(QPointF(x, self.header_height), QPointF(x, total_height))
 
                 # Day number in header
-                painter.setPen(QColor(COLORS["text_secondary"]))
+                painter.setPen(qcolor("text_secondary"))
                 painter.setFont(header_font_small)
                 day_rect = QRectF(x, self.header_height - 20, self.day_width, 18)
                 painter.drawText(day_rect, Qt.AlignmentFlag.AlignCenter, str(d.day))
@@ -130,7 +130,7 @@ class GanttScene(QGraphicsScene):
                 if d.weekday() == 0:  # Monday
                     painter.setPen(grid_pen)
                     painter.drawLine(QPointF(x, self.header_height), QPointF(x, total_height))
-                    painter.setPen(QColor(COLORS["text_secondary"]))
+                    painter.setPen(qcolor("text_secondary"))
                     painter.setFont(header_font_small)
                     week_rect = QRectF(x, self.header_height - 20, 7 * self.day_width, 18)
                     painter.drawText(week_rect, Qt.AlignmentFlag.AlignCenter,
@@ -138,12 +138,12 @@ class GanttScene(QGraphicsScene):
 
             elif effective_scale == TimeScale.MONTH:
                 if d.day == 1:
-                    painter.setPen(QPen(QColor(COLORS["border_light"]), 1))
+                    painter.setPen(QPen(qcolor("border_light"), 1))
                     painter.drawLine(QPointF(x, self.header_height), QPointF(x, total_height))
 
             # Month labels in upper header
             if d.day == 1 or day_idx == start_day:
-                painter.setPen(QColor(COLORS["text_primary"]))
+                painter.setPen(qcolor("text_primary"))
                 painter.setFont(month_font)
                 month_names = ["", "1月", "2月", "3月", "4月", "5月", "6月",
                                "7月", "8月", "9月", "10月", "11月", "12月"]
@@ -161,7 +161,7 @@ class GanttScene(QGraphicsScene):
                 painter.drawLine(QPointF(left, y), QPointF(right, y))
 
         # --- Header bottom line ---
-        painter.setPen(QPen(QColor(COLORS["border_light"]), 1))
+        painter.setPen(QPen(qcolor("border_light"), 1))
         painter.drawLine(QPointF(left, self.header_height),
                          QPointF(right, self.header_height))
 
@@ -186,7 +186,14 @@ class GanttChartView(QGraphicsView):
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
 
         self._task_items: list[TaskBarItem] = []
-        self._dependency_items: list[DependencyArrowItem] = []
+        self._dependency_items: set[DependencyArrowItem] = set()
+        self._arrows_by_task: dict[int, list[DependencyArrowItem]] = {}
+        self._bar_by_id: dict[int, TaskBarItem] = {}
+        self._task_positions: dict[int, tuple[float, float, float, float]] = {}  # id -> (x, y, w, h)
+        self._task_dates: dict[int, tuple[date, date]] = {}  # id -> dates the bar was drawn for
+        # Earliest start / latest end over all tasks, which the scene range is built from
+        self._date_min: date | None = None
+        self._date_max: date | None = None
         self._cached_tasks: list[dict] = []
         self._cached_deps: list[dict] | None = None
         self._show_today_line = True
@@ -229,6 +236,10 @@ class GanttChartView(QGraphicsView):
             
         self._task_items.clear()
         self._dependency_items.clear()
+        self._arrows_by_task.clear()
+        self._bar_by_id.clear()
+        self._task_positions.clear()
+        self._task_dates.clear()
 
         # Cache data for re-render on scale change
         self._cached_tasks = tasks
@@ -244,11 +255,13 @@ class GanttChartView(QGraphicsView):
         if not all_starts or not all_ends:
             return
 
-        self._scene.set_date_range(min(all_starts), max(all_ends))
+        self._date_min = min(all_starts)
+        self._date_max = max(all_ends)
+        self._scene.set_date_range(self._date_min, self._date_max)
         self._scene.num_rows = len(tasks)
 
         # Build task bar positions map
-        task_positions: dict[int, tuple[float, float, float, float]] = {}  # id -> (x, y, w, h)
+        task_positions = self._task_positions
 
         for row, task in enumerate(tasks):
             start = task.get("start_date")
@@ -256,49 +269,22 @@ class GanttChartView(QGraphicsView):
             if not start or not end:
                 continue
 
-            x = self._scene.date_to_x(start)
+            x, width = self._bar_geometry(task)
             y = self._scene.header_height + row * self._scene.row_height
-            width = max(4, (end - start).days * self._scene.day_width)
-
-            if task.get("is_milestone"):
-                width = self._scene.day_width
-                x -= width / 2
 
             bar = TaskBarItem(task, x, y, width, self._scene.row_height)
             bar.signals.date_range_changed.connect(self._on_task_bar_resized)
             self._scene.addItem(bar)
             self._task_items.append(bar)
+            self._bar_by_id[task["id"]] = bar
 
             task_positions[task["id"]] = (x, y, width, self._scene.row_height)
+            self._task_dates[task["id"]] = (start, end)
 
         # Draw dependencies
         if dependencies:
             for dep in dependencies:
-                pred_id = dep.get("predecessor_id")
-                succ_id = dep.get("successor_id")
-                dep_type = dep.get("dep_type", "FS")
-
-                if pred_id in task_positions and succ_id in task_positions:
-                    px, py, pw, ph = task_positions[pred_id]
-                    sx, sy, sw, sh = task_positions[succ_id]
-
-                    # Calculate start/end points based on dependency type
-                    if dep_type == "FS":
-                        start_pt = QPointF(px + pw, py + ph / 2)
-                        end_pt = QPointF(sx, sy + sh / 2)
-                    elif dep_type == "SS":
-                        start_pt = QPointF(px, py + ph / 2)
-                        end_pt = QPointF(sx, sy + sh / 2)
-                    elif dep_type == "FF":
-                        start_pt = QPointF(px + pw, py + ph / 2)
-                        end_pt = QPointF(sx + sw, sy + sh / 2)
-                    else:  # SF
-                        start_pt = QPointF(px, py + ph / 2)
-                        end_pt = QPointF(sx + sw, sy + sh / 2)
-
-                    arrow = DependencyArrowItem(start_pt, end_pt, dep_type)
-                    self._scene.addItem(arrow)
-                    self._dependency_items.append(arrow)
+                self._add_dependency_arrow(dep)
 
         # Aux Lines
         today = date.today()
@@ -340,6 +326,106 @@ class GanttChartView(QGraphicsView):
             self._scene.header_height + len(tasks) * self._scene.row_height + 50
         )
 
+    def _bar_geometry(self, task: dict) -> tuple[float, float]:
+        """Return (x, width) of a task bar for the current scale and date range."""
+        start = task["start_date"]
+        x = self._scene.date_to_x(start)
+        width = max(4, (task["end_date"] - start).days * self._scene.day_width)
+        if task.get("is_milestone"):
+            width = self._scene.day_width
+            x -= width / 2
+        return x, width
+
+    def _add_dependency_arrow(self, dep: dict):
+        """Create the arrow for one dependency if both bars are on the chart."""
+        pred_id = dep.get("predecessor_id")
+        succ_id = dep.get("successor_id")
+        dep_type = dep.get("dep_type", "FS")
+        task_positions = self._task_positions
+
+        if pred_id in task_positions and succ_id in task_positions:
+            px, py, pw, ph = task_positions[pred_id]
+            sx, sy, sw, sh = task_positions[succ_id]
+
+            # Calculate start/end points based on dependency type
+            if dep_type == "FS":
+                start_pt = QPointF(px + pw, py + ph / 2)
+                end_pt = QPointF(sx, sy + sh / 2)
+            elif dep_type == "SS":
+                start_pt = QPointF(px, py + ph / 2)
+                end_pt = QPointF(sx, sy + sh / 2)
+            elif dep_type == "FF":
+                start_pt = QPointF(px + pw, py + ph / 2)
+                end_pt = QPointF(sx + sw, sy + sh / 2)
+            else:  # SF
+                start_pt = QPointF(px, py + ph / 2)
+                end_pt = QPointF(sx + sw, sy + sh / 2)
+
+            arrow = DependencyArrowItem(start_pt, end_pt, dep_type)
+            arrow.dep = dep
+            self._scene.addItem(arrow)
+            self._dependency_items.add(arrow)
+            self._arrows_by_task.setdefault(pred_id, []).append(arrow)
+            if succ_id != pred_id:
+                self._arrows_by_task.setdefault(succ_id, []).append(arrow)
+
+    def update_task(self, task_id: int):
+        """Refresh a single task bar in place after its data was edited.
+
+        Falls back to a full re-render when the edit affects more than the
+        bar and its arrows (no bar yet, date range change, Inazuma line).
+        """
+        bar = self._bar_by_id.get(task_id)
+        if bar is None or self._show_inazuma:
+            self._reload()
+            return
+
+        task = bar.task_data
+        if not task.get("start_date") or not task.get("end_date"):
+            self._reload()
+            return
+
+        # The scene's date range is derived from all tasks; re-render if this
+        # edit may move it: the task leaves the range, or leaves an edge it held
+        start, end = task["start_date"], task["end_date"]
+        old_start, old_end = self._task_dates[task_id]
+        if (start < self._date_min or end > self._date_max or
+                (old_start == self._date_min and start != old_start) or
+                (old_end == self._date_max and end != old_end)):
+            self._reload()
+            return
+        self._task_dates[task_id] = (start, end)
+
+        scene = self._scene
+
+        x, width = self._bar_geometry(task)
+        y = bar.y()
+        old_x, _, old_width, _ = self._task_positions[task_id]
+        bar.setToolTip(bar._build_tooltip())
+        if x == old_x and width == old_width:
+            bar.update()
+            return
+
+        bar.prepareGeometryChange()
+        bar.setX(x)
+        bar.bar_width = max(4, width)
+        bar.update()
+        self._task_positions[task_id] = (x, y, width, scene.row_height)
+
+        # Re-route only the arrows attached to this task
+        arrows = self._arrows_by_task.pop(task_id, [])
+        for arrow in arrows:
+            scene.removeItem(arrow)
+            self._dependency_items.discard(arrow)
+            dep = arrow.dep
+            other = dep.get("predecessor_id")
+            if other == task_id:
+                other = dep.get("successor_id")
+            if other != task_id:
+                self._arrows_by_task[other].remove(arrow)
+        for arrow in arrows:
+            self._add_dependency_arrow(arrow.dep)
+
     def _on_task_bar_resized(self, task_id: int, new_x: float, new_width: float):
         """Handle signal from TaskBarItem being manually resized."""
         new_start = self._scene.x_to_date(new_x)
@@ -433,6 +519,9 @@ class GanttWidget(QWidget):
     def load_tasks(self, tasks, dependencies=None):
         self.chart.load_tasks(tasks, dependencies)
 
+    def update_task(self, task_id: int):
+        self.chart.update_task(task_id)
+
     def _on_scale_changed(self, index):
         scale = self.scale_combo.currentData()
         self.chart.set_time_scale(scale)
@@ -1,14 +1,19 @@
 """Main Window - Application shell with toolbar, split view, and status bar."""
 
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import date, timedelta
+from operator import itemgetter
 import copy
 import re
+import time
 
 from PySide6.QtWidgets import (
     QMainWindow, QSplitter, QWidget, QVBoxLayout, QStatusBar,
-    QMessageBox, QFileDialog, QStackedWidget, QLabel, QMenuBar, QTabWidget
+    QMessageBox, QFileDialog, QStackedWidget, QLabel, QMenuBar, QTabWidget,
+    QProgressDialog, QInputDialog
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QKeySequence, QShortcut
 
 from ui.toolbar import MainToolbar
@@ -21,12 +26,101 @@ from ui.burndown_chart import BurndownWidget
 
 from ui.theme import COLORS
 from utils.sample_data import create_sample_project
-from utils.export_import import tasks_to_csv, csv_to_tasks, project_to_json, json_to_project, export_tasks_to_excel
+from utils.export_import import tasks_to_csv_file, csv_to_tasks, project_to_json, json_to_project, export_tasks_to_excel
 from utils.pptx_export import export_gantt_to_pptx
 from engine.wbs import WBSManager
 
 from config import APP_TITLE, SPLITTER_DEFAULT_RATIO, GANTT_HEADER_HEIGHT, GANTT_ROW_HEIGHT
 
+# Gantt edits of the same task within this window share a single undo entry
+GANTT_EDIT_COALESCE_SEC = 0.4
+
+_get_id = itemgetter("id")
+
+# Predecessor entries like "3", "3FS", "2SS+1d", "4 FF -2d", separated by commas
+_PRED_PATTERN = re.compile(r"(\d+)\s*(FS|FF|SS|SF)?\s*([+-]\d+)?d?", re.IGNORECASE)
+_PRED_SPLIT = re.compile(r"\s*,\s*")
+
+_KEY_NEW = QKeySequence.StandardKey.New
+_KEY_OPEN = QKeySequence.StandardKey.Open
+_KEY_SAVE = QKeySequence.StandardKey.Save
+_KEY_QUIT = QKeySequence.StandardKey.Quit
+_KEY_UNDO = QKeySequence.StandardKey.Undo
+_KEY_REDO = QKeySequence.StandardKey.Redo
+_KEY_DELETE = QKeySequence.StandardKey.Delete
+_KEY_CUT = QKeySequence.StandardKey.Cut
+_KEY_PASTE = QKeySequence.StandardKey.Paste
+
+# Menu bar structure, built once per process.
+# Items: None (separator), (title, sub_items) for a submenu,
+# or (label, shortcut, slot method name, slot args).
+_MENU_SPEC = (
+    ("ファイル(&F)", (
+        ("新規プロジェクト(&N)", _KEY_NEW, "_on_new_project", ()),
+        ("開く(&O)...", _KEY_OPEN, "_on_open", ()),
+        ("保存(&S)...", _KEY_SAVE, "_on_save", ()),
+        None,
+        ("CSVエクスポート...", None, "_on_export_csv", ()),
+        ("CSVインポート...", None, "_on_import_csv", ()),
+        ("PowerPointエクスポート...", None, "_on_export_pptx", ()),
+        None,
+        ("終了(&X)", _KEY_QUIT, "close", ()),
+    )),
+    ("編集(&E)", (
+        ("元に戻す(&Z)", _KEY_UNDO, "_on_undo", ()),
+        ("やり直し(&Y)", _KEY_REDO, "_on_redo", ()),
+    )),
+    ("表示(&V)", (
+        ("ガントチャート(&G)", None, "_switch_view", ("gantt",)),
+        ("リソースシート(&R)", None, "_switch_view", ("resources",)),
+        ("ネットワークチャート(&N)", None, "_switch_view", ("network",)),
+        None,
+        ("テーマ(&M)", (
+            ("🌑 ダークモード", None, "_apply_theme", ("dark",)),
+            ("☀️ 元気が出るモード", None, "_apply_theme", ("energetic",)),
+        )),
+    )),
+    ("タスク(&T)", (
+        ("タスク追加(&A)", Qt.Key.Key_Insert, "_on_add_task", ()),
+        ("タスク削除(&D)", _KEY_DELETE, "_on_delete_task", ()),
+        None,
+        ("カット(&X)", _KEY_CUT, "_on_cut_task", ()),
+        ("ペースト(&V)", _KEY_PASTE, "_on_paste_task", ()),
+        None,
+        ("インデント", Qt.Key.Key_Tab, "_on_indent", ()),
+        ("アウトデント", QKeySequence(Qt.Modifier.SHIFT | Qt.Key.Key_Tab), "_on_outdent", ()),
+        None,
+        ("タスク情報(&I)", None, "_on_task_info", ()),
+    )),
+    ("ヘルプ(&H)", (
+        ("Bokmålについて(&A)", None, "_on_about", ()),
+    )),
+)
+
+
+class _ExportSignals(QObject):
+    """Signals for _ExportJob, since QRunnable doesn't inherit QObject."""
+    finished = Signal(object)  # return value of the export function
+    failed = Signal(str)       # error message
+
+
+class _ExportJob(QRunnable):
+    """Run an export function on a QThreadPool worker thread."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -42,12 +136,17 @@ class MainWindow(QMainWindow):
         self._dependencies: list[dict] = []
         self._resources: list[dict] = []
         self._project: dict = {}
-        self._undo_stack: list[dict] = []
-        self._redo_stack: list[dict] = []
+        self._undo_stack: deque[dict] = deque(maxlen=50)
+        self._redo_stack: deque[dict] = deque(maxlen=50)
         self._clipboard: list[dict] = []  # cut/copy buffer
         self._next_task_id: int = 1
         self._current_view: str = "gantt"  # gantt | resources
         self._current_file: str | None = None
+        # (task_id, monotonic time, undo snapshot pushed for that edit)
+        self._last_gantt_edit: tuple[int, float, dict] | None = None
+        self._resources_dirty: bool = True  # resource sheet needs reloading
+        self._export_job: _ExportJob | None = None  # running background export
+        self._task_by_id: dict[int, dict] = {}  # rebuilt by _refresh_views
 
         # Auto backup timer (5 minutes)
         self._backup_timer = QTimer(self)
@@ -62,134 +161,28 @@ class MainWindow(QMainWindow):
 
     def _build_menu_bar(self):
         menubar = self.menuBar()
-
-        # File menu
-        file_menu = menubar.addMenu("ファイル(&F)")
-
-        new_action = QAction("新規プロジェクト(&N)", self)
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self._on_new_project)
-        file_menu.addAction(new_action)
-
-        open_action = QAction("開く(&O)...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self._on_open)
-        file_menu.addAction(open_action)
-
-        save_action = QAction("保存(&S)...", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self._on_save)
-        file_menu.addAction(save_action)
-
-        file_menu.addSeparator()
-
-        export_csv = QAction("CSVエクスポート...", self)
-        export_csv.triggered.connect(self._on_export_csv)
-        file_menu.addAction(export_csv)
-
-        import_csv = QAction("CSVインポート...", self)
-        import_csv.triggered.connect(self._on_import_csv)
-        file_menu.addAction(import_csv)
-
-        export_pptx = QAction("PowerPointエクスポート...", self)
-        export_pptx.triggered.connect(self._on_export_pptx)
-        file_menu.addAction(export_pptx)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("終了(&X)", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("編集(&E)")
-
-        undo_action = QAction("元に戻す(&Z)", self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self._on_undo)
-        edit_menu.addAction(undo_action)
-
-        redo_action = QAction("やり直し(&Y)", self)
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.triggered.connect(self._on_redo)
-        edit_menu.addAction(redo_action)
-
-        # View menu
-        view_menu = menubar.addMenu("表示(&V)")
-
-        gantt_view = QAction("ガントチャート(&G)", self)
-        gantt_view.triggered.connect(lambda: self._switch_view("gantt"))
-        view_menu.addAction(gantt_view)
-
-        resource_view = QAction("リソースシート(&R)", self)
-        resource_view.triggered.connect(lambda: self._switch_view("resources"))
-        view_menu.addAction(resource_view)
-
-        network_view = QAction("ネットワークチャート(&N)", self)
-        network_view.triggered.connect(lambda: self._switch_view("network"))
-        view_menu.addAction(network_view)
-
-        view_menu.addSeparator()
-        theme_menu = view_menu.addMenu("テーマ(&M)")
-        
-        dark_action = QAction("🌑 ダークモード", self)
-        dark_action.triggered.connect(lambda: self._apply_theme("dark"))
-        theme_menu.addAction(dark_action)
-        
-        energetic_action = QAction("☀️ 元気が出るモード", self)
-        energetic_action.triggered.connect(lambda: self._apply_theme("energetic"))
-        theme_menu.addAction(energetic_action)
-
-        # Task menu
-        task_menu = menubar.addMenu("タスク(&T)")
-
-        add_action = QAction("タスク追加(&A)", self)
-        add_action.setShortcut(Qt.Key.Key_Insert)
-        add_action.triggered.connect(self._on_add_task)
-        task_menu.addAction(add_action)
-
-        del_action = QAction("タスク削除(&D)", self)
-        del_action.setShortcut(QKeySequence.StandardKey.Delete)
-        del_action.triggered.connect(self._on_delete_task)
-        task_menu.addAction(del_action)
-
-        task_menu.addSeparator()
-
-        cut_action = QAction("カット(&X)", self)
-        cut_action.setShortcut(QKeySequence.StandardKey.Cut)
-        cut_action.triggered.connect(self._on_cut_task)
-        task_menu.addAction(cut_action)
-
-        paste_action = QAction("ペースト(&V)", self)
-        paste_action.setShortcut(QKeySequence.StandardKey.Paste)
-        paste_action.triggered.connect(self._on_paste_task)
-        task_menu.addAction(paste_action)
-
-        task_menu.addSeparator()
-
-        indent_action = QAction("インデント", self)
-        indent_action.setShortcut(Qt.Key.Key_Tab)
-        indent_action.triggered.connect(self._on_indent)
-        task_menu.addAction(indent_action)
-
-        outdent_action = QAction("アウトデント", self)
-        outdent_action.setShortcut(QKeySequence(Qt.Modifier.SHIFT | Qt.Key.Key_Tab))
-        outdent_action.triggered.connect(self._on_outdent)
-        task_menu.addAction(outdent_action)
-
-        task_menu.addSeparator()
-
-        info_action = QAction("タスク情報(&I)", self)
-        info_action.triggered.connect(self._on_task_info)
-        task_menu.addAction(info_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("ヘルプ(&H)")
-
-        about_action = QAction("Bokmålについて(&A)", self)
-        about_action.triggered.connect(self._on_about)
-        help_menu.addAction(about_action)
+        for title, items in _MENU_SPEC:
+            self._populate_menu(menubar.addMenu(title), items)
+
+    def _populate_menu(self, menu, items):
+        """Create actions for a menu from a _MENU_SPEC item tuple."""
+        for item in items:
+            if item is None:
+                menu.addSeparator()
+            elif len(item) == 2:
+                title, sub_items = item
+                self._populate_menu(menu.addMenu(title), sub_items)
+            else:
+                label, shortcut, slot, args = item
+                action = QAction(label, self)
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                handler = getattr(self, slot)
+                if args:
+                    action.triggered.connect(lambda *_, f=handler, a=args: f(*a))
+                else:
+                    action.triggered.connect(handler)
+                menu.addAction(action)
 
     def _build_ui(self):
         central = QWidget()
@@ -238,7 +231,7 @@ class MainWindow(QMainWindow):
         # === Resource Sheet View ===
         self.resource_sheet = ResourceSheetView()
         self.resource_sheet.resource_added.connect(self._on_resource_added)
-        self.resource_sheet.resource_updated.connect(self._on_resource_updated)
+        self.resource_sheet.resource_updated.connect(self._refresh_resource_only)
         self.view_stack.addWidget(self.resource_sheet)
 
         layout.addWidget(self.view_stack)
@@ -277,6 +270,7 @@ class MainWindow(QMainWindow):
         tb.sort_waterfall_clicked.connect(self._on_sort_waterfall)
 
         self.task_table.task_data_changed.connect(self._on_task_data_changed)
+        self.task_table.get_model().dataChanged.connect(self._on_task_cell_changed)
         self.task_table.task_moved.connect(self._on_task_moved)
         self.task_table.collapse_state_changed.connect(self._on_collapse_state_changed)
         self.network_chart.dependency_drawn.connect(self._on_dependency_drawn)
@@ -284,26 +278,50 @@ class MainWindow(QMainWindow):
 
     def _load_sample_data(self):
         data = create_sample_project()
-        self._project = data["project"]
-        self._tasks = data["tasks"]
-        self._dependencies = data["dependencies"]
-        self._resources = data["resources"]
-        self._next_task_id = max(t["id"] for t in self._tasks) + 1 if self._tasks else 1
-        self._refresh_views()
+        with self._bulk_mutation():
+            self._project = data["project"]
+            self._tasks = data["tasks"]
+            self._dependencies = data["dependencies"]
+            self._resources = data["resources"]
+            self._resources_dirty = True
+            self._next_task_id = max(map(_get_id, self._tasks), default=0) + 1
 
     def _save_state(self):
         """Save current state for undo."""
-        state = {
-            "tasks": copy.deepcopy(self._tasks),
-            "dependencies": copy.deepcopy(self._dependencies),
-        }
-        self._undo_stack.append(state)
-        if len(self._undo_stack) > 50:
-            self._undo_stack.pop(0)
+        self._undo_stack.append(self._snapshot())
         self._redo_stack.clear()
 
+    def _snapshot(self) -> dict:
+        """Copy tasks and dependencies for the undo/redo stacks.
+
+        Task and dependency dicts only hold immutable values (int, str, bool,
+        date, None), so a per-dict shallow copy is equivalent to deepcopy.
+        """
+        return {
+            "tasks": [t.copy() for t in self._tasks],
+            "dependencies": [d.copy() for d in self._dependencies],
+        }
+
+    @contextmanager
+    def _bulk_mutation(self):
+        """Block view signals during a bulk edit, then refresh every view once.
+
+        The refresh runs before signals are restored so that per-row
+        notifications raised while the views reload (e.g. tree expansion)
+        do not cascade into further Gantt reloads.
+        """
+        widgets = (self.task_table, self.gantt, self.network_chart, self.burndown)
+        was_blocked = [w.blockSignals(True) for w in widgets]
+        try:
+            yield
+            self._refresh_views()
+        finally:
+            for w, blocked in zip(widgets, was_blocked):
+                w.blockSignals(blocked)
+
     def _refresh_views(self):
         """Reload all views with current data."""
+        self._task_by_id = {t["id"]: t for t in self._tasks}
         self._sync_predecessors_to_tasks()
         self.task_table.load_tasks(self._tasks)
         
@@ -311,16 +329,24 @@ class MainWindow(QMainWindow):
         visible_tasks = self.task_table.get_visible_tasks()
         self.gantt.load_tasks(visible_tasks, self._dependencies)
         
-        self.resource_sheet.load_resources(self._resources)
-        self.network_chart.load_tasks(self._tasks, self._dependencies)
+        if self._resources_dirty:
+            self.resource_sheet.load_resources(self._resources)
+            self._resources_dirty = False
+        self.network_chart.load_tasks(self._tasks, self._dependencies, self._task_by_id)
         self.burndown.load_tasks(self._tasks)
         self._update_status_bar()
 
     def _update_status_bar(self):
         total = len(self._tasks)
-        summary = sum(1 for t in self._tasks if t.get("is_summary"))
-        milestones = sum(1 for t in self._tasks if t.get("is_milestone"))
-        critical = sum(1 for t in self._tasks if t.get("is_critical") and not t.get("is_summary"))
+        # Single pass over the task dicts instead of one scan per counter
+        summary = milestones = critical = 0
+        for t in self._tasks:
+            if t.get("is_summary"):
+                summary += 1
+            elif t.get("is_critical"):
+                critical += 1
+            if t.get("is_milestone"):
+                milestones += 1
         self.status_bar.showMessage(
             f"タスク: {total} | サマリー: {summary} | "
             f"マイルストーン: {milestones} | クリティカル: {critical} | "
@@ -341,7 +367,9 @@ class MainWindow(QMainWindow):
     def _apply_theme(self, theme_name: str):
         from ui.theme import apply_theme
         from PySide6.QtWidgets import QApplication
-        apply_theme(QApplication.instance(), theme_name)
+        if not apply_theme(QApplication.instance(), theme_name):
+            return
+        self._resources_dirty = True
         self._refresh_views()
 
     def resizeEvent(self, event):
@@ -422,7 +450,7 @@ class MainWindow(QMainWindow):
         }
         self._next_task_id += 1
         self._tasks.insert(insert_at, new_task)
-        self._recalculate_wbs()
+        self._recalculate_wbs(insert_at)
         self._refresh_views()
 
     def _on_delete_task(self):
@@ -431,19 +459,19 @@ class MainWindow(QMainWindow):
             return
         self._save_state()
 
-        # Delete from end to preserve indices
-        for idx in reversed(indices):
-            if 0 <= idx < len(self._tasks):
-                deleted_id = self._tasks[idx]["id"]
-                self._tasks.pop(idx)
-                # Also remove dependencies involving this task
-                self._dependencies = [
-                    d for d in self._dependencies
-                    if d["predecessor_id"] != deleted_id and d["successor_id"] != deleted_id
-                ]
+        with self._bulk_mutation():
+            # Delete from end to preserve indices
+            for idx in reversed(indices):
+                if 0 <= idx < len(self._tasks):
+                    deleted_id = self._tasks[idx]["id"]
+                    self._tasks.pop(idx)
+                    # Also remove dependencies involving this task
+                    self._dependencies = [
+                        d for d in self._dependencies
+                        if d["predecessor_id"] != deleted_id and d["successor_id"] != deleted_id
+                    ]
 
-        self._recalculate_wbs()
-        self._refresh_views()
+            self._recalculate_wbs(indices[0])
 
     def _on_indent(self):
         indices = self.task_table.get_selected_task_indices()
@@ -455,7 +483,6 @@ class MainWindow(QMainWindow):
         task_objs = _wrap_tasks(self._tasks)
         for idx in indices:
             WBSManager.indent_task(task_objs, idx)
-        _unwrap_tasks(task_objs, self._tasks)
         self._recalculate_wbs()
         self._refresh_views()
 
@@ -468,7 +495,6 @@ class MainWindow(QMainWindow):
         task_objs = _wrap_tasks(self._tasks)
         for idx in indices:
             WBSManager.outdent_task(task_objs, idx)
-        _unwrap_tasks(task_objs, self._tasks)
         self._recalculate_wbs()
         self._refresh_views()
 
@@ -545,7 +571,7 @@ class MainWindow(QMainWindow):
             target_row -= 1
             
         self._tasks.insert(target_row, task)
-        self._recalculate_wbs()
+        self._recalculate_wbs(min(source_row, target_row))
         self._refresh_views()
 
     def _on_dependency_drawn(self, src_id: int, tgt_id: int):
@@ -594,25 +620,42 @@ class MainWindow(QMainWindow):
 
     def _on_gantt_task_date_changed(self, task_id: int, new_start: date, new_end: date):
         """Handle task resize from Gantt chart."""
-        self._save_state()
-        for t in self._tasks:
-            if t["id"] == task_id:
-                t["start_date"] = new_start
-                t["end_date"] = new_end
-                t["duration"] = max(1, (new_end - new_start).days + 1)
-                break
+        # Coalesce rapid edits of the same task (e.g. a bar drag) into one undo entry:
+        # the snapshot taken by the first edit already holds the pre-drag state, as
+        # long as it is still the top of the undo stack (no undo, redo or other
+        # mutation in between).
+        now = time.monotonic()
+        last = self._last_gantt_edit
+        if (last is not None and last[0] == task_id
+                and now - last[1] <= GANTT_EDIT_COALESCE_SEC
+                and self._undo_stack and self._undo_stack[-1] is last[2]):
+            snap = last[2]
+        else:
+            self._save_state()
+            snap = self._undo_stack[-1]
+        self._last_gantt_edit = (task_id, now, snap)
+        t = self._task_by_id.get(task_id)
+        if t is not None:
+            t["start_date"] = new_start
+            t["end_date"] = new_end
+            t["duration"] = max(1, (new_end - new_start).days + 1)
         self._recalculate_wbs()
         self._refresh_views()
-        self.status_bar.showMessage("📅 タスクの期間を変更しました。", 3000)
+        msg = "📅 タスクの期間を変更しました。"
+        if self.status_bar.currentMessage() != msg:
+            self.status_bar.showMessage(msg, 3000)
 
     def _on_task_info(self):
         task = self.task_table.get_selected_task()
         if not task:
             return
-        self._save_state()
+        # Snapshot before exec(): the dialog may write into the task dict
+        snap = self._snapshot()
 
-        dlg = TaskDialog(task, self)
-        if dlg.exec() == TaskDialog.DialogCode.Accepted:
+        dlg = TaskDialog.get_shared(self, task)
+        if dlg.exec() == TaskDialog.DialogCode.Accepted and dlg.changed:
+            self._undo_stack.append(snap)
+            self._redo_stack.clear()
             result = dlg.get_result()
             # Find and update in list
             for i, t in enumerate(self._tasks):
@@ -629,24 +672,24 @@ class MainWindow(QMainWindow):
             return
         self._save_state()
 
-        # Copy selected tasks to clipboard
-        self._clipboard = [copy.deepcopy(self._tasks[i]) for i in indices]
+        with self._bulk_mutation():
+            # Copy selected tasks to clipboard
+            self._clipboard = [copy.deepcopy(self._tasks[i]) for i in indices]
 
-        # Remove selected tasks (reverse order to preserve indices)
-        removed_ids = set()
-        for idx in reversed(indices):
-            if 0 <= idx < len(self._tasks):
-                removed_ids.add(self._tasks[idx]["id"])
-                self._tasks.pop(idx)
+            # Remove selected tasks (reverse order to preserve indices)
+            removed_ids = set()
+            for idx in reversed(indices):
+                if 0 <= idx < len(self._tasks):
+                    removed_ids.add(self._tasks[idx]["id"])
+                    self._tasks.pop(idx)
 
-        # Remove dependencies involving removed tasks
-        self._dependencies = [
-            d for d in self._dependencies
-            if d["predecessor_id"] not in removed_ids and d["successor_id"] not in removed_ids
-        ]
+            # Remove dependencies involving removed tasks
+            self._dependencies = [
+                d for d in self._dependencies
+                if d["predecessor_id"] not in removed_ids and d["successor_id"] not in removed_ids
+            ]
 
-        self._recalculate_wbs()
-        self._refresh_views()
+            self._recalculate_wbs(indices[0])
         self.status_bar.showMessage(f"{len(self._clipboard)}件のタスクをカットしました", 3000)
 
     def _on_paste_task(self):
@@ -658,14 +701,14 @@ class MainWindow(QMainWindow):
         selected = self.task_table.get_selected_task_indices()
         insert_at = selected[-1] + 1 if selected else len(self._tasks)
 
-        for i, task_data in enumerate(self._clipboard):
-            new_task = copy.deepcopy(task_data)
-            new_task["id"] = self._next_task_id
-            self._next_task_id += 1
-            self._tasks.insert(insert_at + i, new_task)
+        with self._bulk_mutation():
+            for i, task_data in enumerate(self._clipboard):
+                new_task = copy.deepcopy(task_data)
+                new_task["id"] = self._next_task_id
+                self._next_task_id += 1
+                self._tasks.insert(insert_at + i, new_task)
 
-        self._recalculate_wbs()
-        self._refresh_views()
+            self._recalculate_wbs(insert_at)
         self.status_bar.showMessage(f"{len(self._clipboard)}件のタスクをペーストしました", 3000)
 
     def _on_collapse_state_changed(self):
@@ -673,13 +716,24 @@ class MainWindow(QMainWindow):
         visible_tasks = self.task_table.get_visible_tasks()
         self.gantt.load_tasks(visible_tasks, self._dependencies)
 
+    def _on_task_cell_changed(self, top_left, bottom_right, roles=()):
+        """Update the edited tasks' Gantt bars in place."""
+        model = self.task_table.get_model()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            task = model.get_task_by_index(top_left.siblingAtRow(row))
+            if task and "id" in task:
+                self.gantt.update_task(task["id"])
+
     def _on_task_data_changed(self):
         """Handle inline edit in task table."""
         self._tasks = self.task_table.get_model().get_flat_tasks()
+        old_deps = self._dependencies
         self._parse_predecessors_from_tasks()
         self._recalculate_wbs()
-        # Refresh gantt only (table already has changes)
-        self.gantt.load_tasks(self._tasks, self._dependencies)
+        # The edited bar was already updated via dataChanged; only a change in
+        # dependencies needs the Gantt arrows to be rebuilt.
+        if self._dependencies != old_deps:
+            self.gantt.load_tasks(self.task_table.get_visible_tasks(), self._dependencies)
         self._update_status_bar()
 
     def _on_scroll_today(self):
@@ -698,10 +752,7 @@ class MainWindow(QMainWindow):
     def _on_undo(self):
         if not self._undo_stack:
             return
-        current = {
-            "tasks": copy.deepcopy(self._tasks),
-            "dependencies": copy.deepcopy(self._dependencies),
-        }
+        current = self._snapshot()
         self._redo_stack.append(current)
 
         state = self._undo_stack.pop()
@@ -712,10 +763,7 @@ class MainWindow(QMainWindow):
     def _on_redo(self):
         if not self._redo_stack:
             return
-        current = {
-            "tasks": copy.deepcopy(self._tasks),
-            "dependencies": copy.deepcopy(self._dependencies),
-        }
+        current = self._snapshot()
         self._undo_stack.append(current)
 
         state = self._redo_stack.pop()
@@ -735,6 +783,7 @@ class MainWindow(QMainWindow):
             self._tasks = []
             self._dependencies = []
             self._resources = []
+            self._resources_dirty = True
             self._project = {"name": "新規プロジェクト", "start_date": date.today()}
             self._next_task_id = 1
             self._undo_stack.clear()
@@ -794,13 +843,14 @@ class MainWindow(QMainWindow):
             "Bokmål Project (*.bokmal);;JSON (*.json);;All Files (*)"
         )
         if path:
-            with open(path, "r", encoding="utf-8") as f:
+            with open(path, "rb") as f:
                 data = json_to_project(f.read())
             self._project = data.get("project", {})
             self._tasks = data.get("tasks", [])
             self._dependencies = data.get("dependencies", [])
             self._resources = data.get("resources", [])
-            self._next_task_id = max((t["id"] for t in self._tasks), default=0) + 1
+            self._resources_dirty = True
+            self._next_task_id = max(map(_get_id, self._tasks), default=0) + 1
             self._undo_stack.clear()
             self._redo_stack.clear()
             self._refresh_views()
@@ -812,9 +862,7 @@ class MainWindow(QMainWindow):
             "CSV Files (*.csv);;All Files (*)"
         )
         if path:
-            csv_str = tasks_to_csv(self._tasks)
-            with open(path, "w", encoding="utf-8-sig") as f:
-                f.write(csv_str)
+            tasks_to_csv_file(self._tasks, path)
             self.status_bar.showMessage(f"CSVエクスポート完了: {path}", 3000)
 
     def _on_import_csv(self):
@@ -826,10 +874,10 @@ class MainWindow(QMainWindow):
             self._save_state()
             with open(path, "r", encoding="utf-8-sig") as f:
                 imported = csv_to_tasks(f.read())
-            self._tasks = imported
-            self._next_task_id = max((t["id"] for t in self._tasks), default=0) + 1
-            self._recalculate_wbs()
-            self._refresh_views()
+            with self._bulk_mutation():
+                self._tasks = imported
+                self._next_task_id = max(map(_get_id, self._tasks), default=0) + 1
+                self._recalculate_wbs()
             self.status_bar.showMessage(f"CSVインポート完了: {path}", 3000)
 
 
@@ -839,27 +887,17 @@ class MainWindow(QMainWindow):
     def _sync_predecessors_to_tasks(self):
         """Generate predecessors display string using task IDs."""
         # Build lookup: successor_id -> list of (pred_id, type, lag)
-        succ_map: dict[int, list[tuple[int, str, int]]] = {}
+        succ_map: defaultdict[int, list[tuple[int, str, int]]] = defaultdict(list)
         for dep in self._dependencies:
-            sid = dep["successor_id"]
-            succ_map.setdefault(sid, []).append(
+            succ_map[dep["successor_id"]].append(
                 (dep["predecessor_id"], dep.get("dep_type", "FS"), dep.get("lag", 0))
             )
 
         for task in self._tasks:
-            preds = succ_map.get(task["id"], [])
-            if preds:
-                parts = []
-                for pred_id, dep_type, lag in preds:
-                    s = str(pred_id) + dep_type
-                    if lag > 0:
-                        s += f"+{lag}d"
-                    elif lag < 0:
-                        s += f"{lag}d"
-                    parts.append(s)
-                task["predecessors"] = ", ".join(parts)
-            else:
-                task["predecessors"] = ""
+            task["predecessors"] = ", ".join(
+                f"{pid}{dt}" if lag == 0 else f"{pid}{dt}{lag:+d}d"
+                for pid, dt, lag in succ_map.get(task["id"], ())
+            )
 
     def _parse_predecessors_from_tasks(self):
         """Parse predecessors strings (task IDs) back into dependency data."""
@@ -867,17 +905,15 @@ class MainWindow(QMainWindow):
 
         new_deps: list[dict] = []
         dep_id = 1
-        pattern = re.compile(r"(\d+)\s*(FS|FF|SS|SF)?\s*([+-]\d+)?d?", re.IGNORECASE)
 
         for task in self._tasks:
             pred_str = task.get("predecessors", "").strip()
             if not pred_str:
                 continue
-            for part in pred_str.split(","):
-                part = part.strip()
+            for part in _PRED_SPLIT.split(pred_str):
                 if not part:
                     continue
-                m = pattern.match(part)
+                m = _PRED_PATTERN.fullmatch(part)
                 if m:
                     pred_task_id = int(m.group(1))
                     if pred_task_id not in valid_ids:
@@ -895,38 +931,81 @@ class MainWindow(QMainWindow):
 
         self._dependencies = new_deps
 
-    def _recalculate_wbs(self):
-        """Recalculate WBS for all tasks."""
+    def _recalculate_wbs(self, start_index: int = 0):
+        """Recalculate WBS for tasks from start_index on.
+
+        Tasks above start_index must be unchanged since the last recalculation.
+        """
         task_objs = _wrap_tasks(self._tasks)
-        WBSManager.recalculate_all(task_objs)
-        _unwrap_tasks(task_objs, self._tasks)
+        WBSManager.recalculate_all(task_objs, start_index)
 
         # Update sort order
-        for i, task in enumerate(self._tasks):
-            task["sort_order"] = i
+        for i in range(start_index, len(self._tasks)):
+            self._tasks[i]["sort_order"] = i
+
+    def _run_export(self, fn, args: tuple, on_done, on_error):
+        """Run an export function in the thread pool behind a busy dialog.
+
+        Exporters cannot be interrupted midway, so the dialog has no cancel
+        button; it only keeps the window responsive while the file is written.
+        """
+        progress = QProgressDialog("エクスポート中...", None, 0, 0, self)
+        progress.setWindowTitle("エクスポート")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        job = _ExportJob(fn, *args)
+        job.signals.finished.connect(progress.close)
+        job.signals.failed.connect(progress.close)
+        job.signals.finished.connect(on_done)
+        job.signals.failed.connect(on_error)
+        self._export_job = job
+        QThreadPool.globalInstance().start(job)
 
     def _on_export_excel(self):
         """Export tasks to Excel format (.xlsx)"""
         path, _ = QFileDialog.getSaveFileName(self, "Excelエクスポート", "", "Excel Files (*.xlsx)")
         if path:
-            success = export_tasks_to_excel(self._tasks, path)
-            if success:
-                self.status_bar.showMessage(f"Excelへエクスポートしました: {path}", 5000)
-            else:
-                QMessageBox.warning(self, "エラー", "openpyxl ライブラリがインストールされていません。\nターミナルで 'pip install openpyxl' を実行してください。")
+            segment_size, ok = QInputDialog.getInt(
+                self, "Excelエクスポート",
+                "1シートあたりの最大行数 (0 = 分割しない):",
+                0, 0, 1_000_000, 1000
+            )
+            if not ok:
+                return
+
+            def on_done(success):
+                if success:
+                    self.status_bar.showMessage(f"Excelへエクスポートしました: {path}", 5000)
+                else:
+                    QMessageBox.warning(self, "エラー", "openpyxl ライブラリがインストールされていません。\nターミナルで 'pip install openpyxl' を実行してください。")
+
+            def on_error(msg):
+                QMessageBox.critical(self, "エラー", f"Excelの書き出しに失敗しました:\n{msg}")
+
+            # Export a snapshot so edits made meanwhile don't race the worker
+            tasks = [t.copy() for t in self._tasks]
+            self._run_export(
+                export_tasks_to_excel, (tasks, path, segment_size or None), on_done, on_error
+            )
 
     def _on_export_pptx(self):
         """Export Gantt chart to PowerPoint format (.pptx)"""
         path, _ = QFileDialog.getSaveFileName(self, "PowerPointエクスポート", "", "PowerPoint Files (*.pptx)")
         if path:
-            try:
-                export_gantt_to_pptx(
-                    self._tasks, self._dependencies, path,
-                    self._project.get("name", "")
-                )
+            def on_done(_result):
                 self.status_bar.showMessage(f"PowerPointへエクスポートしました: {path}", 5000)
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"PPTXの書き出しに失敗しました:\n{e}")
+
+            def on_error(msg):
+                QMessageBox.critical(self, "エラー", f"PPTXの書き出しに失敗しました:\n{msg}")
+
+            snapshot = self._snapshot()
+            self._run_export(
+                export_gantt_to_pptx,
+                (snapshot["tasks"], snapshot["dependencies"], path, self._project.get("name", "")),
+                on_done, on_error,
+            )
 
     def _on_toggle_wbs(self):
         """Toggle WBS panel visibility by adjusting splitter sizes."""
@@ -949,43 +1028,44 @@ class MainWindow(QMainWindow):
         for t in self._tasks:
             nodes[t["id"]] = {"task": t, "children": []}
 
-        wbs_to_id = {t["wbs"]: t["id"] for t in self._tasks if t.get("wbs")}
+        wbs_to_node = {t["wbs"]: nodes[t["id"]] for t in self._tasks if t.get("wbs")}
 
         root_nodes = []
         for t in self._tasks:
             wbs = t.get("wbs", "")
             if "." in wbs:
-                parent_wbs = wbs.rsplit(".", 1)[0]
-                if parent_wbs in wbs_to_id:
-                    parent_id = wbs_to_id[parent_wbs]
-                    nodes[parent_id]["children"].append(nodes[t["id"]])
+                parent = wbs_to_node.get(wbs.rsplit(".", 1)[0])
+                if parent is not None:
+                    parent["children"].append(nodes[t["id"]])
                 else:
                     root_nodes.append(nodes[t["id"]])
             else:
                 root_nodes.append(nodes[t["id"]])
 
+        max_dt = date(2100, 1, 1)
+
         def get_sort_key(node):
             task = node["task"]
             sd = task.get("start_date")
             ed = task.get("end_date")
-            from datetime import date
-            max_dt = date(2100, 1, 1)
             return (sd if sd else max_dt, ed if ed else max_dt, task["id"])
 
-        def sort_tree(node_list):
-            node_list.sort(key=get_sort_key)
-            for n in node_list:
-                sort_tree(n["children"])
-
-        sort_tree(root_nodes)
+        # Sort every level of the tree (iteratively, deep WBS trees are fine)
+        root_nodes.sort(key=get_sort_key)
+        stack = list(root_nodes)
+        while stack:
+            n = stack.pop()
+            n["children"].sort(key=get_sort_key)
+            stack.extend(n["children"])
 
+        # Pre-order traversal
         new_tasks = []
-        def traverse(node_list):
-            for n in node_list:
-                new_tasks.append(n["task"])
-                traverse(n["children"])
-        
-        traverse(root_nodes)
+        stack = list(reversed(root_nodes))
+        while stack:
+            n = stack.pop()
+            new_tasks.append(n["task"])
+            stack.extend(reversed(n["children"]))
+
         self._tasks = new_tasks
         
         self._recalculate_wbs()
@@ -998,14 +1078,21 @@ class MainWindow(QMainWindow):
         if self._resources:
             next_id = max(r.get("id", 0) for r in self._resources) + 1
         res_data["id"] = next_id
-        self._resources.append(res_data)
-        self._refresh_views()
-        self._push_undo("Add Resource")
+        if self._resources_dirty:
+            self._resources.append(res_data)
+            self._refresh_views()
+        else:
+            # The sheet's model holds self._resources and appends the row itself
+            self.resource_sheet.add_resource(res_data)
+            self._update_status_bar()
 
-    def _on_resource_updated(self):
-        """Handle resource edits."""
-        self._refresh_views()
-        self._push_undo("Edit Resource")
+    def _refresh_resource_only(self):
+        """Handle resource edits.
+
+        The sheet's model has already applied the edit to self._resources and
+        no task view reads resource fields, so only the status bar is updated.
+        """
+        self._update_status_bar()
 
     def _on_about(self):
         QMessageBox.about(
@@ -1019,27 +1106,17 @@ class MainWindow(QMainWindow):
 
 # ========== Helper: dict <-> object bridge for WBSManager ==========
 
-class _TaskWrapper:
-    """Minimal wrapper to make dicts behave like objects for WBSManager."""
-    def __init__(self, d: dict):
-        self._d = d
-
-    def __getattr__(self, name):
-        if name == "_d":
-            return super().__getattribute__("_d")
-        return self._d.get(name)
-
-    def __setattr__(self, name, value):
-        if name == "_d":
-            super().__setattr__(name, value)
-        else:
-            self._d[name] = value
+class _TaskView:
+    """Attribute-style view of a task dict for WBSManager.
 
+    The dict itself serves as the instance __dict__, so attribute reads and
+    writes go straight to the task dict without a __getattr__ hook.
+    """
+    __slots__ = ("__dict__",)
 
-def _wrap_tasks(tasks: list[dict]) -> list[_TaskWrapper]:
-    return [_TaskWrapper(t) for t in tasks]
+    def __init__(self, d: dict):
+        self.__dict__ = d
 
 
-def _unwrap_tasks(wrappers: list[_TaskWrapper], original: list[dict]):
-    for w, t in zip(wrappers, original):
-        t.update(w._d)
+def _wrap_tasks(tasks: list[dict]) -> list[_TaskView]:
+    return [_TaskView(t) for t in tasks]
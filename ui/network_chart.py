@@ -1,10 +1,11 @@
 """Network Chart - PERT/dependency network diagram for task relationships."""
 
+from collections import defaultdict, deque
 from datetime import date
 
 from PySide6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsTextItem,
-    QGraphicsLineItem, QWidget, QVBoxLayout, QFrame, QLabel, QHBoxLayout
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsRectItem, QGraphicsTextItem,
+    QGraphicsLineItem, QGraphicsPathItem, QWidget, QVBoxLayout, QFrame, QLabel, QHBoxLayout
 )
 from PySide6.QtCore import Qt, QRectF, QPointF, Signal
 from PySide6.QtGui import (
@@ -23,6 +24,18 @@ V_SPACING = 40
 class TaskNode(QGraphicsRectItem):
     """Visual node for a task in the network diagram."""
 
+    # Paint resources shared by all nodes. Fonts are created on first paint,
+    # once a QGuiApplication exists.
+    _NAME_FONT: QFont | None = None
+    _INFO_FONT: QFont | None = None
+    _WHITE = QColor("#ffffff")
+    _INFO_COL = QColor("#ccccdd")
+    _DATE_COL = QColor("#aaaacc")
+    _NAME_RECT = QRectF(8, 6, NODE_WIDTH - 16, 22)
+    _INFO_RECT = QRectF(8, 30, NODE_WIDTH - 16, 18)
+    _DATE_RECT = QRectF(8, 50, NODE_WIDTH - 16, 18)
+    _TEXT_ALIGN = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+
     def __init__(self, task: dict, x: float, y: float):
         super().__init__(0, 0, NODE_WIDTH, NODE_HEIGHT)
         self.task = task
@@ -45,6 +58,13 @@ class TaskNode(QGraphicsRectItem):
         self.setBrush(QBrush(self._color))
         self.setPen(QPen(self._color.lighter(130), 2))
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsSelectable)
+        # Node content is static: let Qt blit a cached pixmap on pan/zoom.
+        # Nodes are rebuilt on every load_tasks, so the cache never goes stale.
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        # Rounded background shape never changes, so build it once
+        self._bg_path = QPainterPath()
+        self._bg_path.addRoundedRect(self.rect(), 8, 8)
 
         # Pre-compute text lines
         self._name = task.get("name", "")
@@ -69,34 +89,30 @@ class TaskNode(QGraphicsRectItem):
         return QPointF(self.node_x, self.node_y + NODE_HEIGHT / 2)
 
     def paint(self, painter, option, widget=None):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        rect = self.rect()
-
+        # Antialiasing is enabled once on the view (NetworkChartView)
         # Draw rounded rectangle background
-        path = QPainterPath()
-        path.addRoundedRect(rect, 8, 8)
-        painter.fillPath(path, self.brush())
+        painter.fillPath(self._bg_path, self.brush())
         painter.setPen(self.pen())
-        painter.drawPath(path)
+        painter.drawPath(self._bg_path)
+
+        cls = TaskNode
+        if cls._NAME_FONT is None:
+            cls._NAME_FONT = QFont("Segoe UI", 9, QFont.Weight.Bold)
+            cls._INFO_FONT = QFont("Segoe UI", 8)
 
         # Draw task name (bold, white)
-        name_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
-        painter.setFont(name_font)
-        painter.setPen(QColor("#ffffff"))
-        name_rect = QRectF(8, 6, NODE_WIDTH - 16, 22)
-        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, self._name)
+        painter.setFont(cls._NAME_FONT)
+        painter.setPen(cls._WHITE)
+        painter.drawText(cls._NAME_RECT, cls._TEXT_ALIGN, self._name)
 
         # Draw info line (small, light)
-        info_font = QFont("Segoe UI", 8)
-        painter.setFont(info_font)
-        painter.setPen(QColor("#ccccdd"))
-        info_rect = QRectF(8, 30, NODE_WIDTH - 16, 18)
-        painter.drawText(info_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, self._info)
+        painter.setFont(cls._INFO_FONT)
+        painter.setPen(cls._INFO_COL)
+        painter.drawText(cls._INFO_RECT, cls._TEXT_ALIGN, self._info)
 
         # Draw date range (small, dimmer)
-        painter.setPen(QColor("#aaaacc"))
-        date_rect = QRectF(8, 50, NODE_WIDTH - 16, 18)
-        painter.drawText(date_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, self._dates)
+        painter.setPen(cls._DATE_COL)
+        painter.drawText(cls._DATE_RECT, cls._TEXT_ALIGN, self._dates)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -122,6 +138,29 @@ class TaskNode(QGraphicsRectItem):
             pass
 
 
+class DependencyEdge(QGraphicsPathItem):
+    """Dependency curve and its arrowhead drawn as a single scene item."""
+
+    def __init__(self, curve: QPainterPath, arrow: QPolygonF, pen: QPen):
+        super().__init__()
+        self._curve = curve
+        self._arrow = arrow
+        self._arrow_brush = QBrush(pen.color())
+        # Combined path gives Qt the bounding rect and shape of both parts
+        path = QPainterPath(curve)
+        path.addPolygon(arrow)
+        self.setPath(path)
+        self.setPen(pen)
+
+    def paint(self, painter, option, widget=None):
+        # The curve is stroked only; the arrowhead is filled
+        painter.setPen(self.pen())
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(self._curve)
+        painter.setBrush(self._arrow_brush)
+        painter.drawPolygon(self._arrow)
+
+
 class NetworkChartView(QGraphicsView):
     """Network diagram showing tasks and their dependency relationships."""
 
@@ -177,120 +216,127 @@ class NetworkChartView(QGraphicsView):
             self._drag_source_node = None
             self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
 
-    def load_tasks(self, tasks: list[dict], dependencies: list[dict]):
-        """Layout tasks as a network diagram."""
+    def load_tasks(self, tasks: list[dict], dependencies: list[dict],
+                   task_by_id: dict[int, dict] | None = None):
+        """Layout tasks as a network diagram.
+
+        task_by_id may be passed by callers that already hold an id -> task map.
+        """
         self._scene.clear()
         self._nodes.clear()
 
         if not tasks:
             return
 
-        # Build adjacency lists
-        successors: dict[int, list[int]] = {}
-        predecessors_map: dict[int, list[int]] = {}
-        task_ids = {t["id"] for t in tasks}
-
-        for dep in dependencies:
-            pid = dep.get("predecessor_id")
-            sid = dep.get("successor_id")
-            if pid in task_ids and sid in task_ids:
-                successors.setdefault(pid, []).append(sid)
-                predecessors_map.setdefault(sid, []).append(pid)
-
-        # Assign layers (topological sort / longest path)
-        task_map = {t["id"]: t for t in tasks}
-        layers: dict[int, int] = {}
-        self._compute_layers(tasks, predecessors_map, layers)
-
-        # Group by layer
-        layer_groups: dict[int, list[int]] = {}
-        for tid, layer in layers.items():
-            layer_groups.setdefault(layer, []).append(tid)
-
-        max_layer = max(layers.values()) if layers else 0
-
-        # Position nodes
-        for layer_idx in range(max_layer + 1):
-            group = layer_groups.get(layer_idx, [])
-            x = 50 + layer_idx * (NODE_WIDTH + H_SPACING)
-            for row, tid in enumerate(group):
-                y = 50 + row * (NODE_HEIGHT + V_SPACING)
-                task = task_map.get(tid)
-                if task:
-                    node = TaskNode(task, x, y)
-                    self._scene.addItem(node)
-                    self._nodes[tid] = node
-
-        # Draw edges
-        arrow_pen = QPen(QColor(COLORS["accent_light"]), 2)
-        critical_pen = QPen(QColor(COLORS["critical"]), 2.5)
-
-        for dep in dependencies:
-            pid = dep.get("predecessor_id")
-            sid = dep.get("successor_id")
-            if pid in self._nodes and sid in self._nodes:
-                p_node = self._nodes[pid]
-                s_node = self._nodes[sid]
-
-                start = p_node.center_right()
-                end = s_node.center_left()
-
-                # Determine if on critical path
-                is_critical = (task_map.get(pid, {}).get("is_critical") and
-                               task_map.get(sid, {}).get("is_critical"))
-                pen = critical_pen if is_critical else arrow_pen
-
-                # Draw line with routing
-                mid_x = (start.x() + end.x()) / 2
-                path = QPainterPath()
-                path.moveTo(start)
-                path.cubicTo(
-                    QPointF(mid_x, start.y()),
-                    QPointF(mid_x, end.y()),
-                    end
-                )
-                path_item = self._scene.addPath(path, pen)
-
-                # Arrowhead
-                arrow_size = 8
-                angle_line = end - QPointF(mid_x, end.y())
-                if angle_line.x() == 0 and angle_line.y() == 0:
-                    angle_line = QPointF(1, 0)
-                length = (angle_line.x() ** 2 + angle_line.y() ** 2) ** 0.5
-                unit = QPointF(angle_line.x() / length, angle_line.y() / length)
-                perp = QPointF(-unit.y(), unit.x())
-
-                p1 = end - unit * arrow_size + perp * arrow_size * 0.5
-                p2 = end - unit * arrow_size - perp * arrow_size * 0.5
-
-                arrow = QPolygonF([end, p1, p2])
-                arrow_item = self._scene.addPolygon(
-                    arrow, pen, QBrush(pen.color())
-                )
-
-        # Fit scene
-        self._scene.setSceneRect(self._scene.itemsBoundingRect().adjusted(-30, -30, 30, 30))
-
-    def _compute_layers(self, tasks, predecessors_map, layers):
-        """Compute layer for each task using longest path."""
-        task_map = {t["id"]: t for t in tasks}
-        visited = set()
-
-        def get_layer(tid):
-            if tid in layers:
-                return layers[tid]
-            if tid in visited:
-                return 0  # cycle protection
-            visited.add(tid)
-            preds = predecessors_map.get(tid, [])
-            if not preds:
-                layers[tid] = 0
-            else:
-                layers[tid] = max(get_layer(p) + 1 for p in preds)
-            return layers[tid]
+        # Bulk load: skip BSP index maintenance and repaints until done
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.setUpdatesEnabled(False)
 
+        try:
+            # Build adjacency lists
+            successors: defaultdict[int, list[int]] = defaultdict(list)
+            predecessors_map: defaultdict[int, list[int]] = defaultdict(list)
+            task_map = task_by_id if task_by_id is not None else {t["id"]: t for t in tasks}
+
+            for dep in dependencies:
+                pid = dep.get("predecessor_id")
+                sid = dep.get("successor_id")
+                if pid in task_map and sid in task_map:
+                    successors[pid].append(sid)
+                    predecessors_map[sid].append(pid)
+
+            # Assign layers (topological sort / longest path)
+            layers: dict[int, int] = {}
+            self._compute_layers(tasks, successors, predecessors_map, layers)
+
+            # Group by layer
+            layer_groups: defaultdict[int, list[int]] = defaultdict(list)
+            for tid, layer in layers.items():
+                layer_groups[layer].append(tid)
+
+            max_layer = max(layers.values()) if layers else 0
+
+            # Position nodes
+            for layer_idx in range(max_layer + 1):
+                group = layer_groups.get(layer_idx, [])
+                x = 50 + layer_idx * (NODE_WIDTH + H_SPACING)
+                for row, tid in enumerate(group):
+                    y = 50 + row * (NODE_HEIGHT + V_SPACING)
+                    task = task_map.get(tid)
+                    if task:
+                        node = TaskNode(task, x, y)
+                        self._scene.addItem(node)
+                        self._nodes[tid] = node
+
+            # Draw edges
+            arrow_pen = QPen(QColor(COLORS["accent_light"]), 2)
+            critical_pen = QPen(QColor(COLORS["critical"]), 2.5)
+            critical_ids = frozenset(t["id"] for t in tasks if t.get("is_critical"))
+
+            for dep in dependencies:
+                pid = dep.get("predecessor_id")
+                sid = dep.get("successor_id")
+                if pid in self._nodes and sid in self._nodes:
+                    p_node = self._nodes[pid]
+                    s_node = self._nodes[sid]
+
+                    start = p_node.center_right()
+                    end = s_node.center_left()
+
+                    # Determine if on critical path
+                    is_critical = pid in critical_ids and sid in critical_ids
+                    pen = critical_pen if is_critical else arrow_pen
+
+                    # Draw line with routing
+                    mid_x = (start.x() + end.x()) / 2
+                    path = QPainterPath()
+                    path.moveTo(start)
+                    path.cubicTo(
+                        QPointF(mid_x, start.y()),
+                        QPointF(mid_x, end.y()),
+                        end
+                    )
+
+                    # Arrowhead: the curve's last control point is (mid_x, end.y()),
+                    # so the incoming tangent is always horizontal
+                    arrow_size = 8
+                    back = -arrow_size if end.x() >= mid_x else arrow_size
+                    p1 = QPointF(end.x() + back, end.y() + arrow_size * 0.5)
+                    p2 = QPointF(end.x() + back, end.y() - arrow_size * 0.5)
+
+                    arrow = QPolygonF([end, p1, p2])
+                    self._scene.addItem(DependencyEdge(path, arrow, pen))
+
+            # Fit scene
+            self._scene.setSceneRect(self._scene.itemsBoundingRect().adjusted(-30, -30, 30, 30))
+        finally:
+            self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+            self.setUpdatesEnabled(True)
+
+    def _compute_layers(self, tasks, successors, predecessors_map, layers):
+        """Compute layer for each task using longest path.
+
+        Kahn's topological sort, O(V + E) and without recursion. Tasks left
+        over in a dependency cycle keep the layer reached from their acyclic
+        predecessors (0 if none).
+        """
+        in_degree = {t["id"]: len(predecessors_map.get(t["id"], ())) for t in tasks}
+        queue = deque(tid for tid, d in in_degree.items() if d == 0)
+        longest: dict[int, int] = {tid: 0 for tid in queue}
+
+        while queue:
+            tid = queue.popleft()
+            next_layer = longest[tid] + 1
+            for sid in successors.get(tid, ()):
+                if longest.get(sid, 0) < next_layer:
+                    longest[sid] = next_layer
+                in_degree[sid] -= 1
+                if in_degree[sid] == 0:
+                    queue.append(sid)
+
+        # Fill in task order so nodes keep a stable vertical order per layer
         for t in tasks:
-            get_layer(t["id"])
+            layers[t["id"]] = longest.get(t["id"], 0)
 
 
 class NetworkWidget(QWidget):
@@ -339,5 +385,5 @@ class NetworkWidget(QWidget):
         self.chart.dependency_drawn.connect(self.dependency_drawn.emit)
         layout.addWidget(self.chart)
 
-    def load_tasks(self, tasks, dependencies):
-        self.chart.load_tasks(tasks, dependencies)
+    def load_tasks(self, tasks, dependencies, task_by_id=None):
+        self.chart.load_tasks(tasks, dependencies, task_by_id)
@@ -19,17 +19,43 @@ RESOURCE_COLUMNS = [
     {"key": "email", "label": "メール", "width": 150},
 ]
 
+_STRIP_TABLE = str.maketrans("", "", "¥,%")
+_NUMERIC_KEYS = frozenset(("max_units", "standard_rate", "overtime_rate"))
+
+
+def _format_display(key: str, value) -> str:
+    if key == "resource_type":
+        return ResourceType.LABELS.get(value, value)
+    if key in ("standard_rate", "overtime_rate"):
+        return f"¥{value:,.0f}/時" if value else ""
+    if key == "max_units":
+        return f"{value:.0f}%" if value else "100%"
+    return str(value) if value else ""
+
 
 class ResourceTableModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._resources: list[dict] = []
+        # Formatted DisplayRole strings per (row, col); None = not yet formatted
+        self._display_cache: list[list[str | None]] = []
+        self._text_color = QColor(COLORS["text_primary"])
 
     def load(self, resources: list[dict]):
         self.beginResetModel()
         self._resources = resources
+        self._display_cache = [[None] * len(RESOURCE_COLUMNS) for _ in resources]
+        self._text_color = QColor(COLORS["text_primary"])  # theme may have changed
         self.endResetModel()
 
+    def add_resource(self, res: dict):
+        """Append one resource as a row insertion rather than a model reset."""
+        row = len(self._resources)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._resources.append(res)
+        self._display_cache.append([None] * len(RESOURCE_COLUMNS))
+        self.endInsertRows()
+
     def rowCount(self, parent=QModelIndex()):
         return len(self._resources)
 
@@ -39,21 +65,16 @@ class ResourceTableModel(QAbstractTableModel):
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
-        res = self._resources[index.row()]
-        col = RESOURCE_COLUMNS[index.column()]
-        key = col["key"]
-        value = res.get(key, "")
-
         if role == Qt.ItemDataRole.DisplayRole:
-            if key == "resource_type":
-                return ResourceType.LABELS.get(value, value)
-            if key in ("standard_rate", "overtime_rate"):
-                return f"¥{value:,.0f}/時" if value else ""
-            if key == "max_units":
-                return f"{value:.0f}%" if value else "100%"
-            return str(value) if value else ""
+            row, col = index.row(), index.column()
+            s = self._display_cache[row][col]
+            if s is None:
+                key = RESOURCE_COLUMNS[col]["key"]
+                s = _format_display(key, self._resources[row].get(key, ""))
+                self._display_cache[row][col] = s
+            return s
         elif role == Qt.ItemDataRole.ForegroundRole:
-            return QColor(COLORS["text_primary"])
+            return self._text_color
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
@@ -72,16 +93,17 @@ class ResourceTableModel(QAbstractTableModel):
             key = RESOURCE_COLUMNS[index.column()]["key"]
             
             # Simple type parsing
-            val_str = str(value).strip().replace("¥", "").replace(",", "").replace("%", "").replace("/時", "")
+            val_str = str(value).strip().removesuffix("/時").translate(_STRIP_TABLE)
             
-            if key in ("max_units", "standard_rate", "overtime_rate"):
+            if key in _NUMERIC_KEYS:
                 try:
                     res[key] = float(val_str)
                 except ValueError:
                     pass
             else:
                 res[key] = val_str
-                
+
+            self._display_cache[index.row()] = [None] * len(RESOURCE_COLUMNS)
             self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
             return True
         return False
@@ -109,13 +131,16 @@ class ResourceSheetView(QWidget):
         self.table = QTableView()
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table.verticalHeader().setDefaultSectionSize(30)
+        v_header = self.table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)  # uniform rows
+        v_header.setDefaultSectionSize(30)
 
         self._model = ResourceTableModel(self)
         self.table.setModel(self._model)
         self._model.dataChanged.connect(self._on_model_data_changed)
 
         header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         for i, col in enumerate(RESOURCE_COLUMNS):
             header.resizeSection(i, col["width"])
         header.setStretchLastSection(True)
@@ -125,6 +150,10 @@ class ResourceSheetView(QWidget):
     def load_resources(self, resources: list[dict]):
         self._model.load(resources)
 
+    def add_resource(self, res: dict):
+        """Append to the loaded resource list (shared with the caller)."""
+        self._model.add_resource(res)
+
     def _on_model_data_changed(self, top_left, bottom_right, roles):
         self.resource_updated.emit()
 
@@ -8,9 +8,29 @@ from PySide6.QtWidgets import (
     QComboBox, QCheckBox, QTextEdit, QPushButton, QLabel,
     QGroupBox, QDialogButtonBox
 )
-from PySide6.QtCore import Qt, QDate, Signal
+from PySide6.QtCore import Qt, QDate, QTimer, Signal, Slot
 
-from ui.theme import COLORS
+MILESTONE_DEBOUNCE_MS = 30
+
+_PRED_PLACEHOLDER = "例: 1FS, 2SS+1d, 3FF-2d"
+_PRED_HELP = (
+    "書式: タスクID + 種別(FS/SS/FF/SF) + ラグ\n"
+    "例: 1FS (タスク1の終了後に開始)\n"
+    "    2SS+2d (タスク2の開始から2日後に開始)\n"
+    "    3FF-1d (タスク3の終了の1日前に終了)"
+)
+
+
+# QDate Julian day number minus date.toordinal() (both proleptic Gregorian)
+_JD_OFFSET = 1721425
+
+
+def _date_to_qdate(d: date) -> QDate:
+    return QDate.fromJulianDay(d.toordinal() + _JD_OFFSET)
+
+
+def _qdate_to_date(q: QDate) -> date:
+    return date.fromordinal(q.toJulianDay() - _JD_OFFSET)
 
 
 class TaskDialog(QDialog):
@@ -18,18 +38,65 @@ class TaskDialog(QDialog):
 
     task_updated = Signal(dict)
 
+    _CONSTRAINT_ITEMS = (
+        ("制約なし", None),
+        ("指定日以降に開始 (SNET)", "SNET"),
+        ("指定日に開始 (MSO)", "MSO"),
+        ("指定日以前に終了 (FNET)", "FNET"),
+        ("指定日に終了 (MFO)", "MFO"),
+    )
+
+    # Task fields written by _on_accept, per tab, in the order their values are built
+    _GENERAL_KEYS = (
+        "name", "duration", "start_date", "end_date", "actual_start", "actual_end",
+        "progress", "is_milestone", "cost",
+    )
+    _PRED_KEYS = ("predecessors", "constraint_type", "constraint_date")
+
+    # Tabs built on first activation (the General tab is built up front)
+    _PRED_TAB = 1
+    _NOTES_TAB = 2
+
     def __init__(self, task_data: dict | None = None, parent=None):
         super().__init__(parent)
-        self.task_data = task_data or {}
-        self.setWindowTitle("タスク情報" if task_data else "新規タスク")
         self.setMinimumSize(500, 450)
         self.setModal(True)
 
         self._build_ui()
-        if task_data:
+        self.set_task(task_data)
+
+    @classmethod
+    def get_shared(cls, parent, task_data: dict | None = None) -> "TaskDialog":
+        """Return the dialog cached on parent, built on first use, bound to task_data."""
+        dlg = getattr(parent, "_task_dialog", None)
+        if dlg is None:
+            dlg = cls(task_data, parent)
+            parent._task_dialog = dlg
+        else:
+            dlg.set_task(task_data)
+        return dlg
+
+    def set_task(self, task_data: dict | None):
+        """Rebind the already built widgets to task_data (or a blank task)."""
+        self.task_data = task_data or {}
+        self.changed = False
+        self.setWindowTitle("タスク情報" if task_data else "新規タスク")
+        for w in self._field_widgets:
+            w.blockSignals(True)
+        try:
             self._load_data()
+        finally:
+            for w in self._field_widgets:
+                w.blockSignals(False)
+        # toggled was muted above; apply its effect for the final state once
+        self._milestone_timer.stop()
+        if self.milestone_check.isChecked():
+            self._on_milestone_toggled(True)
+        else:
+            self.duration_spin.setEnabled(True)
 
     def _build_ui(self):
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
 
@@ -73,6 +140,9 @@ class TaskDialog(QDialog):
         self.actual_end_edit.setDisplayFormat("yyyy/MM/dd")
         self.actual_end_edit.setSpecialValueText(" ")
         g_layout.addRow("実績終了日:", self.actual_end_edit)
+        # The minimum stands for "no actual date"; it never changes after build
+        self._actual_start_min = self.actual_start_edit.minimumDate()
+        self._actual_end_min = self.actual_end_edit.minimumDate()
 
         self.progress_spin = QDoubleSpinBox()
         self.progress_spin.setRange(0, 100)
@@ -80,38 +150,72 @@ class TaskDialog(QDialog):
         self.progress_spin.setDecimals(0)
         g_layout.addRow("進捗率:", self.progress_spin)
 
+        self.cost_spin = QDoubleSpinBox()
+        self.cost_spin.setRange(0, 999999999)
+        self.cost_spin.setPrefix("¥")
+        self.cost_spin.setDecimals(0)
+        g_layout.addRow("コスト:", self.cost_spin)
+
         self.milestone_check = QCheckBox("マイルストーンとして設定")
         g_layout.addRow("", self.milestone_check)
 
-        self.milestone_check.toggled.connect(self._on_milestone_toggled)
+        # Rapid toggling settles into a single duration update
+        self._milestone_timer = QTimer(self)
+        self._milestone_timer.setSingleShot(True)
+        self._milestone_timer.setInterval(MILESTONE_DEBOUNCE_MS)
+        self._milestone_timer.timeout.connect(self._on_milestone_settled)
+        self.milestone_check.toggled.connect(lambda _: self._milestone_timer.start())
 
         tabs.addTab(general_tab, "一般")
 
-        # === Predecessors Tab ===
-        pred_tab = QWidget()
+        # Predecessors and Notes are filled in by _materialize_tab when first shown
+        tabs.addTab(QWidget(), "依存関係")
+        tabs.addTab(QWidget(), "メモ")
+        self._tabs = tabs
+        self._built = {0}
+        tabs.currentChanged.connect(self._materialize_tab)
+
+        layout.addWidget(tabs)
+
+        # Buttons
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        ok_btn = button_box.button(QDialogButtonBox.StandardButton.Ok)
+        ok_btn.setText("OK")
+        ok_btn.setProperty("primary", True)
+        cancel_btn = button_box.button(QDialogButtonBox.StandardButton.Cancel)
+        cancel_btn.setText("キャンセル")
+        button_box.accepted.connect(self._on_accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+        # Editors whose signals are muted while set_task populates them
+        self._field_widgets = [
+            self.name_edit, self.duration_spin, self.start_date_edit,
+            self.end_date_edit, self.actual_start_edit, self.actual_end_edit,
+            self.progress_spin, self.cost_spin, self.milestone_check,
+        ]
+        self.setUpdatesEnabled(True)
+
+    def _build_pred_tab(self, pred_tab: QWidget):
         p_layout = QFormLayout(pred_tab)
         p_layout.setSpacing(8)
         p_layout.setContentsMargins(16, 16, 16, 16)
 
         self.predecessors_edit = QLineEdit()
-        self.predecessors_edit.setPlaceholderText("例: 1FS, 2SS+1d, 3FF-2d")
+        self.predecessors_edit.setPlaceholderText(_PRED_PLACEHOLDER)
         p_layout.addRow("先行タスク:", self.predecessors_edit)
 
-        info = QLabel("書式: タスクID + 種別(FS/SS/FF/SF) + ラグ\n"
-                       "例: 1FS (タスク1の終了後に開始)\n"
-                       "    2SS+2d (タスク2の開始から2日後に開始)\n"
-                       "    3FF-1d (タスク3の終了の1日前に終了)")
-        info.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
+        info = QLabel(_PRED_HELP)
+        info.setObjectName("taskDialogHelp")
         info.setWordWrap(True)
         p_layout.addRow("", info)
 
         # Constraint
         self.constraint_combo = QComboBox()
-        self.constraint_combo.addItem("制約なし", None)
-        self.constraint_combo.addItem("指定日以降に開始 (SNET)", "SNET")
-        self.constraint_combo.addItem("指定日に開始 (MSO)", "MSO")
-        self.constraint_combo.addItem("指定日以前に終了 (FNET)", "FNET")
-        self.constraint_combo.addItem("指定日に終了 (MFO)", "MFO")
+        for label, code in self._CONSTRAINT_ITEMS:
+            self.constraint_combo.addItem(label, code)
         p_layout.addRow("制約:", self.constraint_combo)
 
         self.constraint_date_edit = QDateEdit()
@@ -119,10 +223,10 @@ class TaskDialog(QDialog):
         self.constraint_date_edit.setDisplayFormat("yyyy/MM/dd")
         p_layout.addRow("制約日:", self.constraint_date_edit)
 
-        tabs.addTab(pred_tab, "依存関係")
+        self._field_widgets += (self.predecessors_edit, self.constraint_combo,
+                                self.constraint_date_edit)
 
-        # === Notes Tab ===
-        notes_tab = QWidget()
+    def _build_notes_tab(self, notes_tab: QWidget):
         n_layout = QVBoxLayout(notes_tab)
         n_layout.setContentsMargins(16, 16, 16, 16)
 
@@ -130,23 +234,26 @@ class TaskDialog(QDialog):
         self.notes_edit.setPlaceholderText("メモを入力...")
         n_layout.addWidget(self.notes_edit)
 
-        tabs.addTab(notes_tab, "メモ")
-
-        layout.addWidget(tabs)
-
-        # Buttons
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        ok_btn = button_box.button(QDialogButtonBox.StandardButton.Ok)
-        ok_btn.setText("OK")
-        ok_btn.setProperty("primary", True)
-        cancel_btn = button_box.button(QDialogButtonBox.StandardButton.Cancel)
-        cancel_btn.setText("キャンセル")
-        button_box.accepted.connect(self._on_accept)
-        button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
-
+        self._field_widgets.append(self.notes_edit)
+
+    @Slot(int)
+    def _materialize_tab(self, idx: int):
+        """Build a deferred tab the first time it is shown and load the task into it."""
+        if idx in self._built:
+            return
+        self._built.add(idx)
+        if idx == self._PRED_TAB:
+            self._build_pred_tab(self._tabs.widget(idx))
+            self._load_pred_tab(self.task_data)
+        elif idx == self._NOTES_TAB:
+            self._build_notes_tab(self._tabs.widget(idx))
+            self._load_notes_tab(self.task_data)
+
+    @Slot()
+    def _on_milestone_settled(self):
+        self._on_milestone_toggled(self.milestone_check.isChecked())
+
+    @Slot(bool)
     def _on_milestone_toggled(self, checked):
         if checked:
             self.duration_spin.setValue(0)
@@ -157,83 +264,113 @@ class TaskDialog(QDialog):
                 self.duration_spin.setValue(1)
 
     def _load_data(self):
+        """Fill every built tab from task_data; an empty dict gives new-task defaults."""
         t = self.task_data
+        today = QDate.currentDate()
         self.name_edit.setText(t.get("name", ""))
         self.duration_spin.setValue(t.get("duration", 1))
         self.progress_spin.setValue(t.get("progress", 0))
         self.milestone_check.setChecked(t.get("is_milestone", False))
         self.cost_spin.setValue(t.get("cost", 0))
-        self.notes_edit.setPlainText(t.get("notes", "") or "")
-        self.predecessors_edit.setText(t.get("predecessors", ""))
 
         start = t.get("start_date")
         if isinstance(start, date):
-            self.start_date_edit.setDate(QDate(start.year, start.month, start.day))
+            self.start_date_edit.setDate(_date_to_qdate(start))
         else:
-            self.start_date_edit.setDate(QDate.currentDate())
+            self.start_date_edit.setDate(today)
 
         end = t.get("end_date")
         if isinstance(end, date):
-            self.end_date_edit.setDate(QDate(end.year, end.month, end.day))
+            self.end_date_edit.setDate(_date_to_qdate(end))
         else:
-            self.end_date_edit.setDate(QDate.currentDate())
+            self.end_date_edit.setDate(today)
 
         act_start = t.get("actual_start")
         if isinstance(act_start, date):
-            self.actual_start_edit.setDate(QDate(act_start.year, act_start.month, act_start.day))
+            self.actual_start_edit.setDate(_date_to_qdate(act_start))
         else:
-            self.actual_start_edit.setDate(self.actual_start_edit.minimumDate())
+            self.actual_start_edit.setDate(self._actual_start_min)
 
         act_end = t.get("actual_end")
         if isinstance(act_end, date):
-            self.actual_end_edit.setDate(QDate(act_end.year, act_end.month, act_end.day))
+            self.actual_end_edit.setDate(_date_to_qdate(act_end))
         else:
-            self.actual_end_edit.setDate(self.actual_end_edit.minimumDate())
+            self.actual_end_edit.setDate(self._actual_end_min)
 
+        if self._PRED_TAB in self._built:
+            self._load_pred_tab(t, today)
+        if self._NOTES_TAB in self._built:
+            self._load_notes_tab(t)
+
+    def _load_pred_tab(self, t: dict, today: QDate | None = None):
+        self.predecessors_edit.setText(t.get("predecessors", ""))
         ct = t.get("constraint_type")
-        if ct:
-            idx = self.constraint_combo.findData(ct)
-            if idx >= 0:
-                self.constraint_combo.setCurrentIndex(idx)
+        idx = self.constraint_combo.findData(ct) if ct else -1
+        self.constraint_combo.setCurrentIndex(max(idx, 0))
         cd = t.get("constraint_date")
         if isinstance(cd, date):
-            self.constraint_date_edit.setDate(QDate(cd.year, cd.month, cd.day))
+            self.constraint_date_edit.setDate(_date_to_qdate(cd))
+        else:
+            self.constraint_date_edit.setDate(today or QDate.currentDate())
+
+    def _load_notes_tab(self, t: dict):
+        self.notes_edit.setPlainText(t.get("notes", "") or "")
 
+    @Slot()
     def _on_accept(self):
+        if self._milestone_timer.isActive():
+            self._milestone_timer.stop()
+            self._on_milestone_settled()
         qd_start = self.start_date_edit.date()
         qd_end = self.end_date_edit.date()
-        qd_constraint = self.constraint_date_edit.date()
         qd_act_start = self.actual_start_edit.date()
         qd_act_end = self.actual_end_edit.date()
 
         # Actual dates: None if at minimum (empty)
         actual_start = None
-        if qd_act_start > self.actual_start_edit.minimumDate():
-            actual_start = date(qd_act_start.year(), qd_act_start.month(), qd_act_start.day())
+        if qd_act_start > self._actual_start_min:
+            actual_start = _qdate_to_date(qd_act_start)
 
         actual_end = None
-        if qd_act_end > self.actual_end_edit.minimumDate():
-            actual_end = date(qd_act_end.year(), qd_act_end.month(), qd_act_end.day())
-
-        result = {
-            "name": self.name_edit.text() or "New Task",
-            "duration": self.duration_spin.value(),
-            "start_date": date(qd_start.year(), qd_start.month(), qd_start.day()),
-            "end_date": date(qd_end.year(), qd_end.month(), qd_end.day()),
-            "actual_start": actual_start,
-            "actual_end": actual_end,
-            "progress": self.progress_spin.value(),
-            "is_milestone": self.milestone_check.isChecked(),
-            "cost": self.cost_spin.value(),
-            "notes": self.notes_edit.toPlainText(),
-            "predecessors": self.predecessors_edit.text(),
-            "constraint_type": self.constraint_combo.currentData(),
-            "constraint_date": date(qd_constraint.year(), qd_constraint.month(), qd_constraint.day()),
-        }
-
-        # Merge with existing data
-        self.task_data.update(result)
-        self.task_updated.emit(self.task_data)
+        if qd_act_end > self._actual_end_min:
+            actual_end = _qdate_to_date(qd_act_end)
+
+        fields = list(zip(self._GENERAL_KEYS, (
+            self.name_edit.text() or "New Task",
+            self.duration_spin.value(),
+            _qdate_to_date(qd_start),
+            _qdate_to_date(qd_end),
+            actual_start,
+            actual_end,
+            self.progress_spin.value(),
+            self.milestone_check.isChecked(),
+            self.cost_spin.value(),
+        )))
+        # Tabs never opened cannot have been edited, so their fields are left alone
+        if self._PRED_TAB in self._built:
+            # Without a constraint the date editor only shows a placeholder
+            constraint_type = self.constraint_combo.currentData()
+            constraint_date = None
+            if constraint_type is not None:
+                constraint_date = _qdate_to_date(self.constraint_date_edit.date())
+            fields += zip(self._PRED_KEYS, (
+                self.predecessors_edit.text(),
+                constraint_type,
+                constraint_date,
+            ))
+        if self._NOTES_TAB in self._built:
+            fields.append(("notes", self.notes_edit.toPlainText()))
+
+        # Write edited fields straight into the task; only notify when one differed
+        td = self.task_data
+        changed = False
+        for key, value in fields:
+            if td.get(key) != value:
+                td[key] = value
+                changed = True
+        self.changed = changed
+        if changed:
+            self.task_updated.emit(td)
         self.accept()
 
     def get_result(self) -> dict:
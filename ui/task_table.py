@@ -7,11 +7,14 @@ from PySide6.QtWidgets import (
     QProgressBar, QStyleOptionViewItem, QAbstractItemView, QStyle, QSlider
 )
 from PySide6.QtCore import (
-    Qt, QAbstractItemModel, QModelIndex, Signal, QDate, QRect, QSize, QMimeData, QByteArray
+    Qt, QAbstractItemModel, QModelIndex, Signal, QDate, QRect, QSize, QMimeData, QByteArray,
+    QPointF, QTimer
+)
+from PySide6.QtGui import (
+    QPainter, QColor, QFont, QIcon, QPen, QBrush, QStaticText, QTransform
 )
-from PySide6.QtGui import QPainter, QColor, QFont, QIcon, QPen, QBrush
 
-from ui.theme import COLORS
+from ui.theme import COLORS, qcolor, theme_version
 from config import GANTT_ROW_HEIGHT, GANTT_HEADER_HEIGHT
 
 
@@ -30,16 +33,63 @@ COLUMNS = [
     {"key": "resource_names", "label": "リソース", "width": 100, "editable": True},
 ]
 
+# Per-column attributes as flat tuples for the per-cell hot paths
+_KEYS = tuple(c["key"] for c in COLUMNS)
+_EDITABLE = tuple(c["editable"] for c in COLUMNS)
+_LABELS = tuple(c["label"] for c in COLUMNS)
+_WIDTHS = tuple(c["width"] for c in COLUMNS)
+_COLUMN_OF = {key: i for i, key in enumerate(_KEYS)}
+
+# yyyy/MM/dd text per date; a plan only spans a limited set of distinct days
+_DATE_TEXT: dict[date, str] = {}
+
+_DARKER: dict[tuple[str, int], QColor] = {}
+_QBRUSHES: dict[str, QBrush] = {}
+_paint_cache_version = theme_version()
+
+
+def _sync_paint_caches():
+    """Drop the cached colours and brushes once the theme has changed."""
+    global _paint_cache_version
+    if _paint_cache_version != theme_version():
+        _DARKER.clear()
+        _QBRUSHES.clear()
+        _paint_cache_version = theme_version()
+
+
+def _darker_color(name: str, factor: int) -> QColor:
+    """Shared darkened QColor for COLORS[name], valid for the current theme."""
+    _sync_paint_caches()
+    key = (name, factor)
+    color = _DARKER.get(key)
+    if color is None:
+        color = _DARKER[key] = qcolor(name).darker(factor)
+    return color
+
+
+def _theme_brush(name: str) -> QBrush:
+    """Shared solid QBrush for COLORS[name], valid for the current theme."""
+    _sync_paint_caches()
+    brush = _QBRUSHES.get(name)
+    if brush is None:
+        brush = _QBRUSHES[name] = QBrush(qcolor(name))
+    return brush
+
 
 class TaskTreeItem:
     """Wrapper for hierarchical task display in tree model."""
 
+    __slots__ = ("task_data", "parent_item", "child_items", "_row", "_cache")
+
     def __init__(self, task_data: dict, parent=None):
         self.task_data = task_data
         self.parent_item = parent
         self.child_items: list[TaskTreeItem] = []
+        self._row = 0  # index within parent_item.child_items, set by append_child
+        self._cache: dict[tuple[int, int], object] = {}  # (column, role) -> data()
 
     def append_child(self, child):
+        child._row = len(self.child_items)
         self.child_items.append(child)
 
     def child(self, row: int):
@@ -51,15 +101,10 @@ class TaskTreeItem:
         return len(self.child_items)
 
     def row(self) -> int:
-        if self.parent_item and self in self.parent_item.child_items:
-            return self.parent_item.child_items.index(self)
-        return 0
+        return self._row
 
     def data(self, column: int):
-        if column < 0 or column >= len(COLUMNS):
-            return None
-        key = COLUMNS[column]["key"]
-        return self.task_data.get(key, "")
+        return self.task_data.get(_KEYS[column], "")
 
 
 class TaskTreeModel(QAbstractItemModel):
@@ -72,35 +117,60 @@ class TaskTreeModel(QAbstractItemModel):
         super().__init__(parent)
         self.root_item = TaskTreeItem({"name": "root"})
         self._flat_tasks: list[dict] = []
+        self._flat_index: dict[int, int] = {}  # id(task dict) -> position in _flat_tasks
+        # FontRole fonts indexed by (is_summary, is_milestone) -> bold, italic
+        self._fonts = {}
+        for bold in (False, True):
+            for italic in (False, True):
+                font = QFont()
+                font.setBold(bold)
+                font.setItalic(italic)
+                self._fonts[bold, italic] = font
 
     def load_tasks(self, tasks: list[dict]):
         """Load flat task list and build tree structure."""
         self.beginResetModel()
         self.root_item = TaskTreeItem({"name": "root"})
         self._flat_tasks = tasks
+        self._flat_index = {id(t): i for i, t in enumerate(tasks)}
 
-        # Build tree from flat list using wbs_level
-        item_stack: list[TaskTreeItem] = [self.root_item]
+        # Build tree from flat list using wbs_level. parents[n] is the latest
+        # item at level n - 1; only parents[:depth + 1] belong to the current
+        # branch, so a level deeper than depth attaches to the deepest one.
+        parents: list[TaskTreeItem] = [self.root_item]
+        depth = 0
 
         for task_data in tasks:
             level = task_data.get("wbs_level", 0)
-            item = TaskTreeItem(task_data)
-
-            # Find correct parent
-            while len(item_stack) > level + 1:
-                item_stack.pop()
-
-            parent = item_stack[-1]
-            item.parent_item = parent
+            if level > depth:
+                level = depth
+            parent = parents[level]
+            item = TaskTreeItem(task_data, parent)
             parent.append_child(item)
 
-            item_stack.append(item)
+            depth = level + 1
+            if depth < len(parents):
+                parents[depth] = item
+            else:
+                parents.append(item)
 
         self.endResetModel()
 
     def get_flat_tasks(self) -> list[dict]:
         return self._flat_tasks
 
+    def flat_row(self, task_data: dict) -> int:
+        """Position of task_data in the flat task list, or -1."""
+        i = self._flat_index.get(id(task_data), -1)
+        flat = self._flat_tasks
+        if 0 <= i < len(flat) and flat[i] is task_data:
+            return i
+        # The caller's list was mutated since load_tasks; fall back to a scan
+        try:
+            return flat.index(task_data)
+        except ValueError:
+            return -1
+
     def rowCount(self, parent=QModelIndex()):
         if parent.column() > 0:
             return 0
@@ -112,89 +182,150 @@ class TaskTreeModel(QAbstractItemModel):
     def columnCount(self, parent=QModelIndex()):
         return len(COLUMNS)
 
+    def hasChildren(self, parent=QModelIndex()):
+        # The base implementation calls rowCount() and columnCount() back in Python
+        if not parent.isValid():
+            return bool(self.root_item.child_items)
+        if parent.column() > 0:
+            return False
+        return bool(parent.internalPointer().child_items)
+
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+        # Roles without a handler (decoration, size hint, tool tip, ...) are
+        # answered before any per-item work
+        handler = self._ROLE_HANDLERS.get(role)
+        if handler is None or not index.isValid():
             return None
 
         item: TaskTreeItem = index.internalPointer()
         col = index.column()
-        key = COLUMNS[col]["key"]
+        # Views ask for the same cell/role many times per repaint; items are
+        # rebuilt on load_tasks and their cache is cleared on setData
+        ck = (col, role)
+        cache = item._cache
+        if ck in cache:
+            return cache[ck]
+        value = handler(self, item, _KEYS[col])
+        cache[ck] = value
+        return value
+
+    def _display_data(self, item: TaskTreeItem, key: str):
         value = item.task_data.get(key, "")
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            if key == "id":
-                return str(item.task_data.get("id", ""))
-            elif key in ("start_date", "end_date", "actual_start", "actual_end"):
-                if isinstance(value, date):
-                    return value.strftime("%Y/%m/%d")
-                return str(value) if value else ""
-            elif key == "progress":
-                return f"{value:.0f}%" if value is not None else "0%"
-            elif key == "duration":
-                if item.task_data.get("is_milestone"):
-                    return "0日"
-                return f"{value}日" if value else "1日"
-            elif key == "cost":
-                return f"¥{value:,.0f}" if value else ""
-            return str(value) if value is not None else ""
-
-        elif role == Qt.ItemDataRole.EditRole:
-            return value
-
-        elif role == Qt.ItemDataRole.FontRole:
-            font = QFont()
-            if item.task_data.get("is_summary"):
-                font.setBold(True)
-            if item.task_data.get("is_milestone"):
-                font.setItalic(True)
-            return font
-
-        elif role == Qt.ItemDataRole.ForegroundRole:
-            if item.task_data.get("is_critical"):
-                return QColor(COLORS["critical"])
-            if item.task_data.get("is_summary"):
-                return QColor(COLORS["accent_light"])
-            return QColor(COLORS["text_primary"])
-
-        elif role == Qt.ItemDataRole.BackgroundRole:
+        if key == "id":
+            return f"{item.task_data.get('id', '')}"
+        elif key in ("start_date", "end_date", "actual_start", "actual_end"):
+            if isinstance(value, date):
+                text = _DATE_TEXT.get(value)
+                if text is None:
+                    text = _DATE_TEXT[value] = f"{value.year}/{value.month:02d}/{value.day:02d}"
+                return text
+            return f"{value}" if value else ""
+        elif key == "progress":
+            return f"{value:.0f}%" if value is not None else "0%"
+        elif key == "duration":
             if item.task_data.get("is_milestone"):
-                return QColor(COLORS["milestone"]).darker(400)
-            return None
-
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            if key in ("duration", "progress", "cost"):
-                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-
-        # Custom roles
-        elif role == Qt.ItemDataRole.UserRole:
-            return item.task_data
-
-        elif role == Qt.ItemDataRole.UserRole + 1:
-            return item.task_data.get("id")
-
+                return "0日"
+            return f"{value}日" if value else "1日"
+        elif key == "cost":
+            return f"¥{value:,.0f}" if value else ""
+        return f"{value}" if value is not None else ""
+
+    def _edit_data(self, item: TaskTreeItem, key: str):
+        return item.task_data.get(key, "")
+
+    def _font_data(self, item: TaskTreeItem, key: str):
+        t = item.task_data
+        return self._fonts[bool(t.get("is_summary")), bool(t.get("is_milestone"))]
+
+    def _foreground_data(self, item: TaskTreeItem, key: str):
+        if item.task_data.get("is_critical"):
+            return qcolor("critical")
+        if item.task_data.get("is_summary"):
+            return qcolor("accent_light")
+        return qcolor("text_primary")
+
+    def _background_data(self, item: TaskTreeItem, key: str):
+        if item.task_data.get("is_milestone"):
+            return _darker_color("milestone", 400)
         return None
 
+    def _alignment_data(self, item: TaskTreeItem, key: str):
+        if key in ("duration", "progress", "cost"):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+    # Custom roles
+    def _task_data(self, item: TaskTreeItem, key: str):
+        return item.task_data
+
+    def _task_id_data(self, item: TaskTreeItem, key: str):
+        return item.task_data.get("id")
+
+    _ROLE_HANDLERS = {
+        Qt.ItemDataRole.DisplayRole: _display_data,
+        Qt.ItemDataRole.EditRole: _edit_data,
+        Qt.ItemDataRole.FontRole: _font_data,
+        Qt.ItemDataRole.ForegroundRole: _foreground_data,
+        Qt.ItemDataRole.BackgroundRole: _background_data,
+        Qt.ItemDataRole.TextAlignmentRole: _alignment_data,
+        Qt.ItemDataRole.UserRole: _task_data,
+        Qt.ItemDataRole.UserRole + 1: _task_id_data,
+    }
+
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
         if not index.isValid() or role != Qt.ItemDataRole.EditRole:
             return False
 
         item: TaskTreeItem = index.internalPointer()
         col = index.column()
-        key = COLUMNS[col]["key"]
+        key = _KEYS[col]
 
         item.task_data[key] = value
+        item._cache.clear()
         self.dataChanged.emit(index, index, [role])
         self.data_changed_signal.emit()
         return True
 
+    def set_data_batch(self, updates: list[tuple[QModelIndex, str, object]]):
+        """Write several (index, key, value) updates with one notification per parent.
+
+        key may be any task field; fields without a column mark the whole row
+        changed. dataChanged covers the bounding box of the touched rows and
+        columns under each parent, followed by a single data_changed_signal.
+        """
+        last_col = len(_KEYS) - 1
+        boxes: dict[int, list] = {}  # id(parent item) -> [parent index, top, bottom, left, right]
+        for index, key, value in updates:
+            if not index.isValid():
+                continue
+            item: TaskTreeItem = index.internalPointer()
+            item.task_data[key] = value
+            item._cache.clear()
+            row = index.row()
+            col = _COLUMN_OF.get(key)
+            left, right = (0, last_col) if col is None else (col, col)
+            box = boxes.get(id(item.parent_item))
+            if box is None:
+                boxes[id(item.parent_item)] = [index.parent(), row, row, left, right]
+            else:
+                box[1] = min(box[1], row)
+                box[2] = max(box[2], row)
+                box[3] = min(box[3], left)
+                box[4] = max(box[4], right)
+        if not boxes:
+            return
+        for parent, top, bottom, left, right in boxes.values():
+            self.dataChanged.emit(self.index(top, left, parent), self.index(bottom, right, parent),
+                                  [Qt.ItemDataRole.EditRole])
+        self.data_changed_signal.emit()
+
     def flags(self, index):
         if not index.isValid():
             return Qt.ItemFlag.ItemIsDropEnabled
         flags = (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable |
                  Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
         col = index.column()
-        if COLUMNS[col]["editable"]:
+        if _EDITABLE[col]:
             flags |= Qt.ItemFlag.ItemIsEditable
         return flags
 
@@ -211,12 +342,10 @@ class TaskTreeModel(QAbstractItemModel):
         if rows:
             # We only support single row move
             item = indexes[0].internalPointer()
-            try:
-                flat_idx = self._flat_tasks.index(item.task_data)
-                encoded_data = QByteArray(str(flat_idx).encode("utf-8"))
+            flat_idx = self.flat_row(item.task_data)
+            if flat_idx >= 0:
+                encoded_data = QByteArray(flat_idx.to_bytes(4, "little", signed=True))
                 mime_data.setData("application/x-bokmal-task-row", encoded_data)
-            except ValueError:
-                pass
         return mime_data
 
     def dropMimeData(self, data: QMimeData, action, row: int, column: int, parent: QModelIndex) -> bool:
@@ -225,7 +354,8 @@ class TaskTreeModel(QAbstractItemModel):
         if not data.hasFormat("application/x-bokmal-task-row"):
             return False
 
-        source_flat_row = int(data.data("application/x-bokmal-task-row").data().decode("utf-8"))
+        source_flat_row = int.from_bytes(
+            data.data("application/x-bokmal-task-row").data(), "little", signed=True)
 
         # Determine target flat row
         target_flat_row = len(self._flat_tasks)  # default to end
@@ -235,63 +365,80 @@ class TaskTreeModel(QAbstractItemModel):
                 parent_item = parent.internalPointer()
                 if row < parent_item.child_count():
                     target_item = parent_item.child_items[row]
-                    try:
-                        target_flat_row = self._flat_tasks.index(target_item.task_data)
-                    except ValueError:
-                        pass
+                    target_flat_row = self._flat_row_or(target_item.task_data, target_flat_row)
                 else:
-                    try:
-                        target_flat_row = self._flat_tasks.index(parent_item.task_data) + 1
-                    except ValueError:
-                        pass
+                    parent_row = self.flat_row(parent_item.task_data)
+                    if parent_row >= 0:
+                        target_flat_row = parent_row + 1
             else:
                 # Dropped at root level
                 if row < self.root_item.child_count():
                     target_item = self.root_item.child_items[row]
-                    try:
-                        target_flat_row = self._flat_tasks.index(target_item.task_data)
-                    except ValueError:
-                        pass
+                    target_flat_row = self._flat_row_or(target_item.task_data, target_flat_row)
         elif parent.isValid():
             # Dropped ON top of an item
             parent_item = parent.internalPointer()
-            try:
-                target_flat_row = self._flat_tasks.index(parent_item.task_data)
-            except ValueError:
-                pass
+            target_flat_row = self._flat_row_or(parent_item.task_data, target_flat_row)
 
-        if source_flat_row == target_flat_row or source_flat_row + 1 == target_flat_row:
+        # The receiver pops the source and re-inserts it, keeping its wbs_level,
+        # so the move is a no-op exactly when the post-removal slot is unchanged
+        if not 0 <= source_flat_row < len(self._flat_tasks):
+            return False
+        new_row = target_flat_row - 1 if source_flat_row < target_flat_row else target_flat_row
+        if new_row == source_flat_row:
             return False
 
         self.task_moved.emit(source_flat_row, target_flat_row)
         return True
 
+    def _flat_row_or(self, task_data: dict, default: int) -> int:
+        i = self.flat_row(task_data)
+        return i if i >= 0 else default
+
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
             if 0 <= section < len(COLUMNS):
-                return COLUMNS[section]["label"]
+                return _LABELS[section]
         return None
 
     def index(self, row, column, parent=QModelIndex()):
-        if not self.hasIndex(row, column, parent):
-            return QModelIndex()
-        if not parent.isValid():
-            parent_item = self.root_item
-        else:
+        # Bounds are checked directly rather than via hasIndex(), which would
+        # call back into the Python rowCount()/columnCount() overrides
+        if parent.isValid():
+            if parent.column() > 0:
+                return QModelIndex()
             parent_item = parent.internalPointer()
-        child_item = parent_item.child(row)
-        if child_item:
-            return self.createIndex(row, column, child_item)
+        else:
+            parent_item = self.root_item
+        children = parent_item.child_items
+        if 0 <= row < len(children) and 0 <= column < len(_KEYS):
+            return self.createIndex(row, column, children[row])
         return QModelIndex()
 
     def parent(self, index):
         if not index.isValid():
             return QModelIndex()
-        child_item: TaskTreeItem = index.internalPointer()
-        parent_item = child_item.parent_item
-        if parent_item is None or parent_item == self.root_item:
+        parent_item = index.internalPointer().parent_item
+        if parent_item is None or parent_item is self.root_item:
             return QModelIndex()
-        return self.createIndex(parent_item.row(), 0, parent_item)
+        return self.createIndex(parent_item._row, 0, parent_item)
+
+    def iter_items_dfs(self, descend=None):
+        """Yield (item, depth) in display order without creating QModelIndex objects.
+
+        descend(item) is asked for items with children; returning False skips
+        that item's subtree.
+        """
+        stack = [(child, 0) for child in reversed(self.root_item.child_items)]
+        while stack:
+            item, depth = stack.pop()
+            yield item, depth
+            children = item.child_items
+            if children and (descend is None or descend(item)):
+                stack.extend((child, depth + 1) for child in reversed(children))
+
+    def index_for_item(self, item: TaskTreeItem) -> QModelIndex:
+        return self.createIndex(item._row, 0, item)
 
     def get_task_by_index(self, index: QModelIndex) -> dict | None:
         if index.isValid():
@@ -303,9 +450,39 @@ class TaskTreeModel(QAbstractItemModel):
 class TaskItemDelegate(QStyledItemDelegate):
     """Custom delegate for task table cells."""
 
+    _PCT_FONT: QFont | None = None  # built on first paint (needs a QApplication)
+    _PCT_STATIC: dict[int, QStaticText] = {}  # percentage -> laid-out "N%" label
+    _SLIDER_STYLES: dict[tuple[str, str], str] = {}  # (border, progress) -> QSS
+
+    @classmethod
+    def _slider_stylesheet(cls) -> str:
+        """Progress slider QSS, built once per theme's colour pair."""
+        key = (COLORS["border"], COLORS["progress"])
+        qss = cls._SLIDER_STYLES.get(key)
+        if qss is None:
+            border, progress = key
+            qss = cls._SLIDER_STYLES[key] = f"""
+                QSlider::groove:horizontal {{
+                    height: 6px;
+                    background: {border};
+                    border-radius: 3px;
+                }}
+                QSlider::handle:horizontal {{
+                    width: 14px;
+                    margin: -4px 0;
+                    border-radius: 7px;
+                    background: {progress};
+                }}
+                QSlider::sub-page:horizontal {{
+                    background: {progress};
+                    border-radius: 3px;
+                }}
+            """
+        return qss
+
     def createEditor(self, parent, option, index):
         col = index.column()
-        key = COLUMNS[col]["key"]
+        key = _KEYS[col]
 
         if key == "name":
             editor = QLineEdit(parent)
@@ -327,23 +504,7 @@ class TaskItemDelegate(QStyledItemDelegate):
             editor.setRange(0, 100)
             editor.setSingleStep(5)
             editor.setPageStep(10)
-            editor.setStyleSheet(f"""
-                QSlider::groove:horizontal {{
-                    height: 6px;
-                    background: {COLORS['border']};
-                    border-radius: 3px;
-                }}
-                QSlider::handle:horizontal {{
-                    width: 14px;
-                    margin: -4px 0;
-                    border-radius: 7px;
-                    background: {COLORS['progress']};
-                }}
-                QSlider::sub-page:horizontal {{
-                    background: {COLORS['progress']};
-                    border-radius: 3px;
-                }}
-            """)
+            editor.setStyleSheet(self._slider_stylesheet())
             return editor
         elif key == "cost":
             editor = QDoubleSpinBox(parent)
@@ -361,8 +522,6 @@ class TaskItemDelegate(QStyledItemDelegate):
 
     def setEditorData(self, editor, index):
         value = index.model().data(index, Qt.ItemDataRole.EditRole)
-        col = index.column()
-        key = COLUMNS[col]["key"]
 
         if isinstance(editor, QSpinBox):
             editor.setValue(int(value) if value else 0)
@@ -381,9 +540,6 @@ class TaskItemDelegate(QStyledItemDelegate):
             super().setEditorData(editor, index)
 
     def setModelData(self, editor, model, index):
-        col = index.column()
-        key = COLUMNS[col]["key"]
-
         if isinstance(editor, QSpinBox):
             model.setData(index, editor.value())
         elif isinstance(editor, QSlider):
@@ -400,7 +556,7 @@ class TaskItemDelegate(QStyledItemDelegate):
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
         col = index.column()
-        key = COLUMNS[col]["key"]
+        key = _KEYS[col]
 
         if key == "progress":
             # Draw progress bar
@@ -409,10 +565,10 @@ class TaskItemDelegate(QStyledItemDelegate):
             progress = float(value) if value else 0.0
 
             # Background
-            painter.fillRect(option.rect, QColor(COLORS["bg_secondary"]))
+            painter.fillRect(option.rect, qcolor("bg_secondary"))
 
             if option.state & QStyle.StateFlag.State_Selected:
-                painter.fillRect(option.rect, QColor(COLORS["selection"]))
+                painter.fillRect(option.rect, qcolor("selection"))
 
             # Progress bar
             bar_rect = QRect(
@@ -422,21 +578,33 @@ class TaskItemDelegate(QStyledItemDelegate):
                 8
             )
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(COLORS["border"]))
+            painter.setBrush(_theme_brush("border"))
             painter.drawRoundedRect(bar_rect, 3, 3)
 
             if progress > 0:
                 fill_width = int(bar_rect.width() * progress / 100)
                 fill_rect = QRect(bar_rect.x(), bar_rect.y(), fill_width, bar_rect.height())
-                painter.setBrush(QColor(COLORS["progress"]))
+                painter.setBrush(_theme_brush("progress"))
                 painter.drawRoundedRect(fill_rect, 3, 3)
 
             # Text
-            painter.setPen(QColor(COLORS["text_secondary"]))
-            painter.setFont(QFont("Segoe UI", 9))
-            painter.drawText(option.rect.adjusted(4, 0, -4, 0),
-                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                             f"{progress:.0f}%")
+            painter.setPen(qcolor("text_secondary"))
+            if TaskItemDelegate._PCT_FONT is None:
+                TaskItemDelegate._PCT_FONT = QFont("Segoe UI", 9)
+            painter.setFont(self._PCT_FONT)
+            pct = round(progress)
+            label = self._PCT_STATIC.get(pct)
+            if label is None:
+                label = QStaticText(f"{pct}%")
+                label.prepare(QTransform(), self._PCT_FONT)
+                self._PCT_STATIC[pct] = label
+            # Right-aligned 4px from the edge, vertically centred
+            size = label.size()
+            rect = option.rect
+            painter.drawStaticText(
+                QPointF(rect.right() - 3 - size.width(),
+                        rect.y() + (rect.height() - size.height()) / 2),
+                label)
             painter.restore()
         else:
             super().paint(painter, option, index)
@@ -487,17 +655,30 @@ class TaskTableView(QTreeView):
         self._model.data_changed_signal.connect(self._on_data_changed)
         self._model.task_moved.connect(self.task_moved.emit)
 
-        # Expand/Collapse signals
-        self.expanded.connect(lambda idx: self.collapse_state_changed.emit())
-        self.collapsed.connect(lambda idx: self.collapse_state_changed.emit())
+        # Visible rows, rebuilt lazily after any change to structure or expansion
+        self._visible_cache: list[dict] | None = None
+        self._model.modelReset.connect(self._invalidate_visible)
+        self._model.rowsInserted.connect(self._invalidate_visible)
+        self._model.rowsRemoved.connect(self._invalidate_visible)
+        self.expanded.connect(self._invalidate_visible)
+        self.collapsed.connect(self._invalidate_visible)
+
+        # Expand/Collapse signals, coalesced so a burst of expansions within one
+        # event-loop pass produces a single collapse_state_changed
+        self._collapse_signal_timer = QTimer(self)
+        self._collapse_signal_timer.setSingleShot(True)
+        self._collapse_signal_timer.setInterval(0)
+        self._collapse_signal_timer.timeout.connect(self.collapse_state_changed.emit)
+        self.expanded.connect(lambda _idx: self._collapse_signal_timer.start())
+        self.collapsed.connect(lambda _idx: self._collapse_signal_timer.start())
 
         # Selection
         self.selectionModel().currentChanged.connect(self._on_selection_changed)
 
         # Header
         header = self.header()
-        for i, col in enumerate(COLUMNS):
-            header.resizeSection(i, col["width"])
+        for i, width in enumerate(_WIDTHS):
+            header.resizeSection(i, width)
         header.setStretchLastSection(True)
         header.setSectionsMovable(True)
         # Visually reorder: # (logical 1) | WBS (logical 2) | タスク名 (logical 0) | ...
@@ -509,49 +690,74 @@ class TaskTableView(QTreeView):
 
     def load_tasks(self, tasks: list[dict]):
         """Load tasks into the tree model."""
+        model = self._model
+        row_count = model.rowCount
+        index = model.index
+        get_task = model.get_task_by_index
+
         # Save expanded state to restore after reload
         expanded_ids = set()
         if hasattr(self, "_first_load_done"):
-            def save_state(parent_index):
-                for row in range(self._model.rowCount(parent_index)):
-                    idx = self._model.index(row, 0, parent_index)
-                    if self.isExpanded(idx):
-                        task = self._model.get_task_by_index(idx)
+            is_expanded = self.isExpanded
+            stack = [QModelIndex()]
+            while stack:
+                parent_index = stack.pop()
+                for row in range(row_count(parent_index)):
+                    idx = index(row, 0, parent_index)
+                    if is_expanded(idx):
+                        task = get_task(idx)
                         if task and "id" in task:
                             expanded_ids.add(task["id"])
-                        save_state(idx)
-            save_state(QModelIndex())
+                        stack.append(idx)
 
-        self._model.load_tasks(tasks)
+        model.load_tasks(tasks)
 
         if not hasattr(self, "_first_load_done"):
             self.expandAll()
             self._first_load_done = True
         else:
-            # Restore expanded state
-            def restore_state(parent_index):
-                for row in range(self._model.rowCount(parent_index)):
-                    idx = self._model.index(row, 0, parent_index)
-                    task = self._model.get_task_by_index(idx)
-                    if task and "id" in task and task["id"] in expanded_ids:
-                        self.expand(idx)
-                    if self._model.rowCount(idx) > 0:
-                        restore_state(idx)
-            restore_state(QModelIndex())
+            # Restore expanded state: expand everything in one pass, then
+            # collapse the parents that were not expanded before the reload
+            was_blocked = self.blockSignals(True)
+            self.setUpdatesEnabled(False)
+            self.expandAll()
+            collapse = self.collapse
+            stack = [QModelIndex()]
+            while stack:
+                parent_index = stack.pop()
+                for row in range(row_count(parent_index)):
+                    idx = index(row, 0, parent_index)
+                    if row_count(idx) == 0:
+                        continue
+                    task = get_task(idx)
+                    if not (task and "id" in task and task["id"] in expanded_ids):
+                        collapse(idx)
+                    stack.append(idx)
+            self.setUpdatesEnabled(True)
+            self.blockSignals(was_blocked)
+        # expandAll() and the blocked collapses above do not notify
+        self._visible_cache = None
+
+    def _invalidate_visible(self, *args):
+        self._visible_cache = None
 
     def get_visible_tasks(self) -> list[dict]:
-        """Get tasks currently visible in the tree (not hidden by collapsed parents)."""
-        visible_tasks = []
-        def traverse(parent_index):
-            for row in range(self._model.rowCount(parent_index)):
-                idx = self._model.index(row, 0, parent_index)
-                task = self._model.get_task_by_index(idx)
-                if task:
-                    visible_tasks.append(task)
-                # Traverse children only if current node is expanded
-                if self.isExpanded(idx) and self._model.rowCount(idx) > 0:
-                    traverse(idx)
-        traverse(QModelIndex())
+        """Get tasks currently visible in the tree (not hidden by collapsed parents).
+
+        The list is cached until the tree is reloaded or a row is expanded or
+        collapsed; callers must not modify it.
+        """
+        if self._visible_cache is not None:
+            return self._visible_cache
+        model = self._model
+        is_expanded = self.isExpanded
+        index_for_item = model.index_for_item
+        # Only parents need an index, to ask the view whether they are expanded
+        visible_tasks = [
+            item.task_data
+            for item, _depth in model.iter_items_dfs(lambda it: is_expanded(index_for_item(it)))
+        ]
+        self._visible_cache = visible_tasks
         return visible_tasks
 
     def sizeHintForRow(self, row):
@@ -568,15 +774,13 @@ class TaskTableView(QTreeView):
     def get_selected_task_indices(self) -> list[int]:
         """Get indices of selected tasks in the flat task list."""
         indices = []
+        flat_row = self._model.flat_row
         for index in self.selectionModel().selectedRows():
             task = self._model.get_task_by_index(index)
             if task:
-                flat = self._model.get_flat_tasks()
-                try:
-                    idx = flat.index(task)
+                idx = flat_row(task)
+                if idx >= 0:
                     indices.append(idx)
-                except ValueError:
-                    pass
         return sorted(indices)
 
     def _on_selection_changed(self, current: QModelIndex, previous: QModelIndex):
@@ -1,29 +1,153 @@
-"""Dark theme QSS stylesheet for UniTK."""
+"""Theme palettes and QSS stylesheets (dark and energetic) for Bokmål."""
 
+import re
+import sys
+from functools import cache
+from string import Template
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-def get_theme_stylesheet() -> str:
-    """Return the dark theme QSS stylesheet."""
-    return """
+from config import QSS_RAW
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor
+
+
+def _freeze(palette: dict[str, str]) -> MappingProxyType:
+    """Read-only view of a palette, with its hex strings interned."""
+    return MappingProxyType({k: sys.intern(v) for k, v in palette.items()})
+
+
+# Color constants used in Python code (read-only; COLORS holds the active copy)
+DARK_COLORS = _freeze({
+    "bg_primary": "#1a1b2e",
+    "bg_secondary": "#14152e",
+    "bg_header": "#12132a",
+    "bg_hover": "#22234a",
+    "accent": "#6c6cff",
+    "accent_light": "#8a8aff",
+    "accent_gradient_start": "#4a8cff",
+    "accent_gradient_end": "#6c6cff",
+    "critical": "#ff6b6b",
+    "critical_dark": "#cc4444",
+    "milestone": "#ffd700",
+    "summary_bar": "#8888cc",
+    "progress": "#4a8cff",
+    "text_primary": "#e0e0e8",
+    "text_secondary": "#a0a0c0",
+    "text_muted": "#606080",
+    "border": "#2a2b4a",
+    "border_light": "#3a3b6e",
+    "grid_line": "#1e1f3e",
+    "selection": "#3a3b8e",
+    "today_line": "#ff6b6b",
+    "weekend_bg": "#111225",
+    "gantt_bg": "#14152e",
+    "gantt_header_bg": "#1a1b3e",
+    "dependency_arrow": "#8888bb",
+    "baseline": "#555577",
+})
+
+ENERGETIC_COLORS = _freeze({
+    "bg_primary": "#fff5e6",
+    "bg_secondary": "#ffe4b5",
+    "bg_header": "#ff8c00",
+    "bg_hover": "#ffa07a",
+    "accent": "#ff4500",
+    "accent_light": "#ff7f50",
+    "accent_gradient_start": "#ffd700",
+    "accent_gradient_end": "#ff8c00",
+    "critical": "#dc143c",
+    "critical_dark": "#b22222",
+    "milestone": "#ff6347",
+    "summary_bar": "#32cd32",
+    "progress": "#ff4500",
+    "text_primary": "#4a2511",
+    "text_secondary": "#8b4513",
+    "text_muted": "#a0522d",
+    "border": "#f4a460",
+    "border_light": "#ffdab9",
+    "grid_line": "#ffdead",
+    "selection": "#ffb6c1",
+    "today_line": "#ff0000",
+    "weekend_bg": "#ffefd5",
+    "gantt_bg": "#ffffff",
+    "gantt_header_bg": "#ffd700",
+    "dependency_arrow": "#ff4500",
+    "baseline": "#cd853f",
+})
+
+COLORS = DARK_COLORS.copy()
+
+# Parsed QColor per COLORS entry, filled on first use and after apply_theme;
+# painters use qcolor(). Built lazily so the palettes import without Qt.
+QCOLORS: dict[str, "QColor"] = {}
+
+# Bumped by every apply_theme call; caches of derived paint objects compare against it
+THEME_VERSION = 0
+
+
+def _ensure_qcolors():
+    """Parse the active palette into QCOLORS if it is empty."""
+    if not QCOLORS:
+        from PySide6.QtGui import QColor
+        QCOLORS.update({k: QColor(v) for k, v in COLORS.items()})
+
+
+def qcolor(name: str) -> "QColor":
+    """Return the shared QColor for COLORS[name]. Do not modify it in place."""
+    color = QCOLORS.get(name)
+    if color is None:
+        _ensure_qcolors()
+        color = QCOLORS[name]
+    return color
+
+
+# Theme whose stylesheet is currently on the application, None before the first apply_theme
+_CURRENT_THEME: str | None = None
+
+
+def theme_version() -> int:
+    """Return THEME_VERSION (a plain import of the int would go stale)."""
+    return THEME_VERSION
+
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r" ?([{};]) ?")
+
+
+def _minify(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt tokenizes a compact sheet."""
+    qss = _QSS_SPACE.sub(" ", _QSS_COMMENT.sub("", qss))
+    return _QSS_PUNCT_SPACE.sub(r"\1", qss).strip()
+
+
+# Rules shared verbatim by every theme; each theme appends its own overrides
+_BASE_QSS = """
     /* ===== Global ===== */
     * {
         font-family: "Segoe UI", "Yu Gothic UI", "Meiryo UI", sans-serif;
         font-size: 13px;
     }
+"""
 
+# Theme-specific rules; $name placeholders are filled from the matching palette
+_DARK_OVERRIDES = Template("""
     QMainWindow {
-        background-color: #1a1b2e;
+        background-color: $bg_primary;
     }
 
     QWidget {
-        background-color: #1a1b2e;
-        color: #e0e0e8;
+        background-color: $bg_primary;
+        color: $text_primary;
     }
 
     /* ===== Menu Bar ===== */
     QMenuBar {
-        background-color: #12132a;
+        background-color: $bg_header;
         color: #c0c0d0;
-        border-bottom: 1px solid #2a2b4a;
+        border-bottom: 1px solid $border;
         padding: 2px;
     }
     QMenuBar::item {
@@ -31,11 +155,11 @@ def get_theme_stylesheet() -> str:
         border-radius: 4px;
     }
     QMenuBar::item:selected {
-        background-color: #3a3b6e;
+        background-color: $border_light;
     }
     QMenu {
         background-color: #1e1f3a;
-        border: 1px solid #3a3b6e;
+        border: 1px solid $border_light;
         border-radius: 6px;
         padding: 4px;
     }
@@ -48,20 +172,20 @@ def get_theme_stylesheet() -> str:
     }
     QMenu::separator {
         height: 1px;
-        background-color: #2a2b4a;
+        background-color: $border;
         margin: 4px 8px;
     }
 
     /* ===== Toolbar ===== */
     QToolBar {
-        background-color: #12132a;
-        border-bottom: 1px solid #2a2b4a;
+        background-color: $bg_header;
+        border-bottom: 1px solid $border;
         padding: 4px 8px;
         spacing: 4px;
     }
     QToolBar::separator {
         width: 1px;
-        background-color: #2a2b4a;
+        background-color: $border;
         margin: 4px 6px;
     }
     QToolButton {
@@ -86,61 +210,61 @@ def get_theme_stylesheet() -> str:
 
     /* ===== Splitter ===== */
     QSplitter::handle {
-        background-color: #2a2b4a;
+        background-color: $border;
         width: 3px;
     }
     QSplitter::handle:hover {
-        background-color: #6c6cff;
+        background-color: $accent;
     }
 
     /* ===== Tree / Table View ===== */
     QTreeView, QTableView {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         alternate-background-color: #181936;
         border: none;
-        gridline-color: #2a2b4a;
-        selection-background-color: #3a3b8e;
+        gridline-color: $border;
+        selection-background-color: $selection;
         selection-color: #ffffff;
         outline: none;
     }
     QTreeView::item, QTableView::item {
         padding: 4px 8px;
-        border-bottom: 1px solid #1e1f3e;
+        border-bottom: 1px solid $grid_line;
         min-height: 26px;
     }
     QTreeView::item:hover, QTableView::item:hover {
-        background-color: #22234a;
+        background-color: $bg_hover;
     }
 
     QHeaderView {
-        background-color: #12132a;
+        background-color: $bg_header;
         border: none;
     }
     QHeaderView::section {
-        background-color: #1a1b3e;
-        color: #a0a0c0;
+        background-color: $gantt_header_bg;
+        color: $text_secondary;
         padding: 6px 8px;
         border: none;
-        border-right: 1px solid #2a2b4a;
-        border-bottom: 1px solid #2a2b4a;
+        border-right: 1px solid $border;
+        border-bottom: 1px solid $border;
         font-weight: 600;
         font-size: 11px;
         text-transform: uppercase;
         letter-spacing: 0.5px;
     }
     QHeaderView::section:hover {
-        background-color: #22234a;
+        background-color: $bg_hover;
         color: #d0d0e8;
     }
 
     /* ===== ScrollBar ===== */
     QScrollBar:vertical {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         width: 10px;
         border: none;
     }
     QScrollBar::handle:vertical {
-        background-color: #3a3b6e;
+        background-color: $border_light;
         border-radius: 5px;
         min-height: 30px;
         margin: 2px;
@@ -152,12 +276,12 @@ def get_theme_stylesheet() -> str:
         height: 0;
     }
     QScrollBar:horizontal {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         height: 10px;
         border: none;
     }
     QScrollBar::handle:horizontal {
-        background-color: #3a3b6e;
+        background-color: $border_light;
         border-radius: 5px;
         min-width: 30px;
         margin: 2px;
@@ -173,44 +297,44 @@ def get_theme_stylesheet() -> str:
     QStatusBar {
         background-color: #0e0f24;
         color: #8080a0;
-        border-top: 1px solid #2a2b4a;
+        border-top: 1px solid $border;
         padding: 2px 8px;
         font-size: 11px;
     }
 
     /* ===== Dialogs & Input ===== */
     QDialog {
-        background-color: #1a1b3e;
-        border: 1px solid #3a3b6e;
+        background-color: $gantt_header_bg;
+        border: 1px solid $border_light;
         border-radius: 8px;
     }
     QLineEdit {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         border: 1px solid #2a2b5e;
         border-radius: 4px;
         padding: 6px 8px;
-        color: #e0e0e8;
+        color: $text_primary;
         selection-background-color: #4a4bae;
     }
     QLineEdit:focus {
-        border-color: #6c6cff;
+        border-color: $accent;
     }
     QSpinBox, QDoubleSpinBox, QDateEdit {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         border: 1px solid #2a2b5e;
         border-radius: 4px;
         padding: 4px 8px;
-        color: #e0e0e8;
+        color: $text_primary;
     }
     QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus {
-        border-color: #6c6cff;
+        border-color: $accent;
     }
     QComboBox {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         border: 1px solid #2a2b5e;
         border-radius: 4px;
         padding: 4px 8px;
-        color: #e0e0e8;
+        color: $text_primary;
         min-width: 80px;
     }
     QComboBox:hover {
@@ -222,7 +346,7 @@ def get_theme_stylesheet() -> str:
     }
     QComboBox QAbstractItemView {
         background-color: #1e1f3a;
-        border: 1px solid #3a3b6e;
+        border: 1px solid $border_light;
         selection-background-color: #4a4bae;
     }
 
@@ -242,12 +366,12 @@ def get_theme_stylesheet() -> str:
         background-color: #5a5bbe;
     }
     QPushButton:disabled {
-        background-color: #2a2b4a;
-        color: #606080;
+        background-color: $border;
+        color: $text_muted;
     }
     QPushButton[primary="true"] {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-            stop:0 #6c6cff, stop:1 #8a6cff);
+            stop:0 $accent, stop:1 #8a6cff);
     }
     QPushButton[primary="true"]:hover {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
@@ -256,12 +380,12 @@ def get_theme_stylesheet() -> str:
 
     /* ===== Tab Widget ===== */
     QTabWidget::pane {
-        border: 1px solid #2a2b4a;
+        border: 1px solid $border;
         border-radius: 4px;
-        background-color: #1a1b3e;
+        background-color: $gantt_header_bg;
     }
     QTabBar::tab {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         color: #8080a0;
         padding: 8px 16px;
         border: none;
@@ -269,16 +393,16 @@ def get_theme_stylesheet() -> str:
     }
     QTabBar::tab:hover {
         color: #c0c0e0;
-        background-color: #1e1f3e;
+        background-color: $grid_line;
     }
     QTabBar::tab:selected {
         color: #ffffff;
-        border-bottom: 2px solid #6c6cff;
+        border-bottom: 2px solid $accent;
     }
 
     /* ===== Progress Bar ===== */
     QProgressBar {
-        background-color: #14152e;
+        background-color: $bg_secondary;
         border: none;
         border-radius: 3px;
         height: 6px;
@@ -288,7 +412,7 @@ def get_theme_stylesheet() -> str:
     }
     QProgressBar::chunk {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-            stop:0 #4a8cff, stop:1 #6c6cff);
+            stop:0 $accent_gradient_start, stop:1 $accent_gradient_end);
         border-radius: 3px;
     }
 
@@ -302,6 +426,10 @@ def get_theme_stylesheet() -> str:
         font-weight: 700;
         color: #e0e0f0;
     }
+    QLabel#taskDialogHelp {
+        color: $text_muted;
+        font-size: 11px;
+    }
 
     /* ===== CheckBox ===== */
     QCheckBox {
@@ -311,13 +439,13 @@ def get_theme_stylesheet() -> str:
     QCheckBox::indicator {
         width: 16px;
         height: 16px;
-        border: 1px solid #3a3b6e;
+        border: 1px solid $border_light;
         border-radius: 3px;
-        background-color: #14152e;
+        background-color: $bg_secondary;
     }
     QCheckBox::indicator:checked {
-        background-color: #6c6cff;
-        border-color: #6c6cff;
+        background-color: $accent;
+        border-color: $accent;
     }
 
     /* ===== ToolTip ===== */
@@ -332,234 +460,181 @@ def get_theme_stylesheet() -> str:
 
     /* ===== Group Box ===== */
     QGroupBox {
-        border: 1px solid #2a2b4a;
+        border: 1px solid $border;
         border-radius: 6px;
         margin-top: 12px;
         padding-top: 16px;
         font-weight: 600;
-        color: #a0a0c0;
+        color: $text_secondary;
     }
     QGroupBox::title {
         subcontrol-origin: margin;
         subcontrol-position: top left;
         padding: 0 8px;
-        color: #a0a0c0;
+        color: $text_secondary;
     }
-    """
+    """)
 
 
-# Color constants used in Python code
-DARK_COLORS = {
-    "bg_primary": "#1a1b2e",
-    "bg_secondary": "#14152e",
-    "bg_header": "#12132a",
-    "bg_hover": "#22234a",
-    "accent": "#6c6cff",
-    "accent_light": "#8a8aff",
-    "accent_gradient_start": "#4a8cff",
-    "accent_gradient_end": "#6c6cff",
-    "critical": "#ff6b6b",
-    "critical_dark": "#cc4444",
-    "milestone": "#ffd700",
-    "summary_bar": "#8888cc",
-    "progress": "#4a8cff",
-    "text_primary": "#e0e0e8",
-    "text_secondary": "#a0a0c0",
-    "text_muted": "#606080",
-    "border": "#2a2b4a",
-    "border_light": "#3a3b6e",
-    "grid_line": "#1e1f3e",
-    "selection": "#3a3b8e",
-    "today_line": "#ff6b6b",
-    "weekend_bg": "#111225",
-    "gantt_bg": "#14152e",
-    "gantt_header_bg": "#1a1b3e",
-    "dependency_arrow": "#8888bb",
-    "baseline": "#555577",
-}
+def _build_stylesheet(overrides: Template, palette) -> str:
+    """Fill a theme's overrides from its palette and prepend the base rules."""
+    qss = _BASE_QSS + overrides.safe_substitute(palette)
+    return qss if QSS_RAW else _minify(qss)
 
-ENERGETIC_COLORS = {
-    "bg_primary": "#fff5e6",
-    "bg_secondary": "#ffe4b5",
-    "bg_header": "#ff8c00",
-    "bg_hover": "#ffa07a",
-    "accent": "#ff4500",
-    "accent_light": "#ff7f50",
-    "accent_gradient_start": "#ffd700",
-    "accent_gradient_end": "#ff8c00",
-    "critical": "#dc143c",
-    "critical_dark": "#b22222",
-    "milestone": "#ff6347",
-    "summary_bar": "#32cd32",
-    "progress": "#ff4500",
-    "text_primary": "#4a2511",
-    "text_secondary": "#8b4513",
-    "text_muted": "#a0522d",
-    "border": "#f4a460",
-    "border_light": "#ffdab9",
-    "grid_line": "#ffdead",
-    "selection": "#ffb6c1",
-    "today_line": "#ff0000",
-    "weekend_bg": "#ffefd5",
-    "gantt_bg": "#ffffff",
-    "gantt_header_bg": "#ffd700",
-    "dependency_arrow": "#ff4500",
-    "baseline": "#cd853f",
-}
 
-COLORS = DARK_COLORS.copy()
+@cache
+def get_theme_stylesheet() -> str:
+    """Return the dark theme QSS stylesheet (built on first call)."""
+    return _build_stylesheet(_DARK_OVERRIDES, DARK_COLORS)
 
-def get_energetic_theme_stylesheet() -> str:
-    """Return the energetic theme QSS stylesheet."""
-    return """
+
+_ENERGETIC_OVERRIDES = Template("""
     /* ===== Global Energetic ===== */
     * {
-        font-family: "Segoe UI", "Yu Gothic UI", "Meiryo UI", sans-serif;
-        font-size: 13px;
         font-weight: 600;
     }
 
     QMainWindow {
-        background-color: #fff5e6;
+        background-color: $bg_primary;
     }
 
     QWidget {
-        background-color: #fff5e6;
-        color: #4a2511;
+        background-color: $bg_primary;
+        color: $text_primary;
     }
 
     /* ===== Menu Bar ===== */
     QMenuBar {
-        background-color: #ff8c00;
+        background-color: $bg_header;
         color: #ffffff;
-        border-bottom: 2px solid #f4a460;
+        border-bottom: 2px solid $border;
         padding: 4px;
     }
     QMenuBar::item:selected {
-        background-color: #ff4500;
+        background-color: $accent;
         border-radius: 4px;
     }
     QMenu {
-        background-color: #ffe4b5;
-        border: 2px solid #f4a460;
+        background-color: $bg_secondary;
+        border: 2px solid $border;
         border-radius: 6px;
         padding: 6px;
     }
     QMenu::item {
-        color: #4a2511;
+        color: $text_primary;
     }
     QMenu::item:selected {
-        background-color: #ff4500;
+        background-color: $accent;
         color: #ffffff;
     }
 
     /* ===== Toolbar ===== */
     QToolBar {
-        background-color: #ff8c00;
-        border-bottom: 2px solid #f4a460;
+        background-color: $bg_header;
+        border-bottom: 2px solid $border;
         padding: 6px;
     }
     QToolButton {
         background-color: #ffffff;
-        border: 1px solid #f4a460;
+        border: 1px solid $border;
         border-radius: 4px;
         padding: 4px 6px;
-        color: #4a2511;
+        color: $text_primary;
         font-size: 12px;
         font-weight: 600;
     }
     QToolButton:hover {
-        background-color: #ffe4b5;
-        border-color: #ff4500;
+        background-color: $bg_secondary;
+        border-color: $accent;
     }
     QToolButton:pressed {
-        background-color: #ffb6c1;
+        background-color: $selection;
     }
     QToolButton:checked {
-        background-color: #ff4500;
+        background-color: $accent;
         color: #ffffff;
     }
 
     /* ===== Tree / Table View ===== */
     QTreeView, QTableView {
         background-color: #ffffff;
-        alternate-background-color: #fff5e6;
-        border: 2px solid #ffdab9;
-        gridline-color: #ffdead;
-        selection-background-color: #ffb6c1;
-        selection-color: #b22222;
+        alternate-background-color: $bg_primary;
+        border: 2px solid $border_light;
+        gridline-color: $grid_line;
+        selection-background-color: $selection;
+        selection-color: $critical_dark;
     }
     QTreeView::item, QTableView::item {
         padding: 4px 8px;
-        border-bottom: 1px solid #ffdead;
+        border-bottom: 1px solid $grid_line;
         min-height: 28px;
     }
     QTreeView::item:hover, QTableView::item:hover {
-        background-color: #ffe4b5;
-        color: #4a2511;
+        background-color: $bg_secondary;
+        color: $text_primary;
     }
 
     QHeaderView {
-        background-color: #ffd700;
+        background-color: $gantt_header_bg;
     }
     QHeaderView::section {
-        background-color: #ffd700;
-        color: #4a2511;
+        background-color: $gantt_header_bg;
+        color: $text_primary;
         padding: 6px 8px;
-        border: 1px solid #f4a460;
+        border: 1px solid $border;
         font-size: 12px;
         font-weight: bold;
     }
 
     /* ===== Dialogs & Input ===== */
     QDialog {
-        background-color: #ffe4b5;
-        border: 2px solid #f4a460;
+        background-color: $bg_secondary;
+        border: 2px solid $border;
         border-radius: 8px;
     }
     QLineEdit, QSpinBox, QDoubleSpinBox, QDateEdit, QComboBox {
         background-color: #ffffff;
-        border: 2px solid #ffdab9;
+        border: 2px solid $border_light;
         border-radius: 4px;
         padding: 4px 8px;
-        color: #4a2511;
+        color: $text_primary;
     }
     QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus {
-        border-color: #ff4500;
+        border-color: $accent;
     }
 
     /* ===== Buttons ===== */
     QPushButton {
         background-color: #ffffff;
-        color: #4a2511;
-        border: 2px solid #f4a460;
+        color: $text_primary;
+        border: 2px solid $border;
         border-radius: 4px;
         padding: 6px 16px;
         font-weight: 600;
     }
     QPushButton:hover {
-        background-color: #ffe4b5;
-        border-color: #ff4500;
+        background-color: $bg_secondary;
+        border-color: $accent;
     }
     QPushButton:pressed {
-        background-color: #ff8c00;
+        background-color: $bg_header;
         color: #ffffff;
     }
     QPushButton[primary="true"] {
-        background-color: #ff4500;
+        background-color: $accent;
         color: #ffffff;
-        border-color: #b22222;
+        border-color: $critical_dark;
     }
 
     /* ===== Tab Widget ===== */
     QTabWidget::pane {
-        border: 2px solid #ffdab9;
+        border: 2px solid $border_light;
         border-radius: 4px;
         background-color: #ffffff;
     }
     QTabBar::tab {
-        background-color: #ffd700;
-        color: #4a2511;
+        background-color: $gantt_header_bg;
+        color: $text_primary;
         padding: 8px 16px;
         border-top-left-radius: 6px;
         border-top-right-radius: 6px;
@@ -567,35 +642,64 @@ def get_energetic_theme_stylesheet() -> str:
         font-weight: bold;
     }
     QTabBar::tab:selected {
-        background-color: #ff4500;
+        background-color: $accent;
         color: #ffffff;
-        border: 2px solid #f4a460;
+        border: 2px solid $border;
         border-bottom: none;
     }
 
     /* ===== CheckBox ===== */
     QCheckBox {
-        color: #4a2511;
+        color: $text_primary;
         spacing: 8px;
     }
     QCheckBox::indicator {
         width: 18px;
         height: 18px;
-        border: 2px solid #f4a460;
+        border: 2px solid $border;
         border-radius: 4px;
         background-color: #ffffff;
     }
     QCheckBox::indicator:checked {
-        background-color: #ff4500;
-        border-color: #ff4500;
+        background-color: $accent;
+        border-color: $accent;
     }
-    """
 
-def apply_theme(app, theme_name="dark"):
-    global COLORS
+    /* ===== Label ===== */
+    QLabel#taskDialogHelp {
+        color: $text_muted;
+        font-size: 11px;
+    }
+    """)
+
+
+@cache
+def get_energetic_theme_stylesheet() -> str:
+    """Return the energetic theme QSS stylesheet (built on first call)."""
+    return _build_stylesheet(_ENERGETIC_OVERRIDES, ENERGETIC_COLORS)
+
+
+def apply_theme(app, theme_name="dark", force=False) -> bool:
+    """Switch palette and stylesheet; return False if theme_name was already applied.
+
+    Re-setting an identical stylesheet still makes Qt re-polish every widget,
+    so repeated calls are skipped unless force is set.
+    """
+    # COLORS is updated in place: other modules hold it via "from ui.theme import COLORS"
+    global THEME_VERSION, _CURRENT_THEME
+    if theme_name != "energetic":
+        theme_name = "dark"
+    if theme_name == _CURRENT_THEME and not force:
+        return False
     if theme_name == "energetic":
         COLORS.update(ENERGETIC_COLORS)
-        app.setStyleSheet(get_energetic_theme_stylesheet())
+        stylesheet = get_energetic_theme_stylesheet()
     else:
         COLORS.update(DARK_COLORS)
-        app.setStyleSheet(get_theme_stylesheet())
+        stylesheet = get_theme_stylesheet()
+    QCOLORS.clear()
+    _ensure_qcolors()
+    THEME_VERSION += 1
+    app.setStyleSheet(stylesheet)
+    _CURRENT_THEME = theme_name
+    return True
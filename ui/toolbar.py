@@ -9,18 +9,36 @@ from PySide6.QtGui import QAction, QIcon, QFont
 
 from ui.theme import COLORS
 
+_BUTTON_FONT: QFont | None = None  # shared by all buttons, built on first use (needs a QApplication)
+
 
 class ToolbarGroup(QFrame):
     """A labeled group of toolbar buttons."""
 
-    def __init__(self, title: str, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet(f"""
+    # (border, text_muted) -> (frame QSS, label QSS), formatted once per theme
+    _STYLES: dict[tuple[str, str], tuple[str, str]] = {}
+
+    @classmethod
+    def _styles(cls) -> tuple[str, str]:
+        key = (COLORS["border"], COLORS["text_muted"])
+        styles = cls._STYLES.get(key)
+        if styles is None:
+            border, text_muted = key
+            styles = cls._STYLES[key] = (
+                f"""
             ToolbarGroup {{
-                border-right: 1px solid {COLORS['border']};
+                border-right: 1px solid {border};
                 padding: 0 4px;
             }}
-        """)
+        """,
+                f"color: {text_muted}; font-size: 9px;",
+            )
+        return styles
+
+    def __init__(self, title: str, parent=None):
+        super().__init__(parent)
+        frame_style, label_style = self._styles()
+        self.setStyleSheet(frame_style)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 2, 4, 0)
         layout.setSpacing(0)
@@ -33,7 +51,7 @@ class ToolbarGroup(QFrame):
 
         label = QLabel(title)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 9px;")
+        label.setStyleSheet(label_style)
         layout.addWidget(label)
 
     def add_button(self, btn: QToolButton):
@@ -43,18 +61,59 @@ class ToolbarGroup(QFrame):
 def _make_button(text: str, icon_text: str = "", tooltip: str = "",
                  checkable: bool = False) -> QToolButton:
     """Create a styled toolbar button."""
-    btn = QToolButton()
-    if icon_text:
-        btn.setText(f"{icon_text} {text}")
-    else:
-        btn.setText(text)
-    btn.setToolTip(tooltip or text)
-    btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-    btn.setCheckable(checkable)
-    btn.setMinimumWidth(32)
-    font = QFont("Segoe UI", 11)
-    btn.setFont(font)
-    return btn
+    global _BUTTON_FONT
+    if _BUTTON_FONT is None:
+        _BUTTON_FONT = QFont("Segoe UI", 11)
+    # Qt properties passed to the constructor are applied in one binding call
+    return QToolButton(
+        text=f"{icon_text} {text}" if icon_text else text,
+        toolTip=tooltip or text,
+        toolButtonStyle=Qt.ToolButtonStyle.ToolButtonTextOnly,
+        checkable=checkable,
+        minimumWidth=32,
+        font=_BUTTON_FONT,
+    )
+
+
+# Toolbar structure: (group title, buttons), each button being
+# (attribute name, text, icon text, tooltip, MainToolbar signal name).
+_TOOLBAR_SPEC = (
+    ("ファイル", (
+        ("btn_new", "新規", "📄", "新規プロジェクトを作成", "new_project_clicked"),
+        ("btn_save", "保存", "💾", "プロジェクトを保存", "save_clicked"),
+        ("btn_open", "開く", "📂", "プロジェクトを開く", "open_clicked"),
+    )),
+    ("編集", (
+        ("btn_undo", "戻す", "↩", "元に戻す (Ctrl+Z)", "undo_clicked"),
+        ("btn_redo", "やり直", "↪", "やり直し (Ctrl+Y)", "redo_clicked"),
+    )),
+    ("タスク", (
+        ("btn_add", "追加", "➕", "新規タスクを追加 (Insert)", "add_task_clicked"),
+        ("btn_delete", "削除", "🗑", "タスクを削除 (Delete)", "delete_task_clicked"),
+        ("btn_info", "情報", "ℹ", "タスク情報を表示", "task_info_clicked"),
+        ("btn_milestone", "MS", "◆", "マイルストーン切替", "milestone_clicked"),
+    )),
+    ("表示・整列", (
+        ("btn_toggle_wbs", "WBS", "◀▶", "WBS表示切替", "toggle_wbs_clicked"),
+        ("btn_sort_wf", "WF", "🌊", "ウォーターフォール順に並べ替え", "sort_waterfall_clicked"),
+    )),
+    ("構造", (
+        ("btn_indent", "→", "→", "インデント (Tab)", "indent_clicked"),
+        ("btn_outdent", "←", "←", "アウトデント (Shift+Tab)", "outdent_clicked"),
+        ("btn_link", "🔗", "🔗", "タスクをリンク", "link_tasks_clicked"),
+        ("btn_unlink", "✂", "✂", "リンク解除", "unlink_tasks_clicked"),
+    )),
+    ("スケジュール", (
+        ("btn_baseline", "基準", "📋", "ベースライン設定", "set_baseline_clicked"),
+        ("btn_today", "今日", "📅", "今日にスクロール", "scroll_today_clicked"),
+    )),
+    ("データ", (
+        ("btn_export", "CSV", "📤", "CSVエクスポート", "export_csv_clicked"),
+        ("btn_export_excel", "Excel", "📊", "Excel(.xlsx)エクスポート", "export_excel_clicked"),
+        ("btn_export_pptx", "PPT", "📽️", "PowerPoint(.pptx)ガントエクスポート", "export_pptx_clicked"),
+        ("btn_import", "読込", "📥", "CSVインポート", "import_csv_clicked"),
+    )),
+)
 
 
 class MainToolbar(QToolBar):
@@ -92,132 +151,23 @@ class MainToolbar(QToolBar):
         self._build_toolbar()
 
     def _build_toolbar(self):
-        # === File Group ===
-        file_group = ToolbarGroup("ファイル")
-
-        self.btn_new = _make_button("新規", "📄", "新規プロジェクトを作成")
-        self.btn_new.clicked.connect(self.new_project_clicked.emit)
-        file_group.add_button(self.btn_new)
-
-        self.btn_save = _make_button("保存", "💾", "プロジェクトを保存")
-        self.btn_save.clicked.connect(self.save_clicked.emit)
-        file_group.add_button(self.btn_save)
-
-        self.btn_open = _make_button("開く", "📂", "プロジェクトを開く")
-        self.btn_open.clicked.connect(self.open_clicked.emit)
-        file_group.add_button(self.btn_open)
-
-        self.addWidget(file_group)
-        self.addSeparator()
-
-        # === Edit Group ===
-        edit_group = ToolbarGroup("編集")
-
-        self.btn_undo = _make_button("戻す", "↩", "元に戻す (Ctrl+Z)")
-        self.btn_undo.clicked.connect(self.undo_clicked.emit)
-        edit_group.add_button(self.btn_undo)
-
-        self.btn_redo = _make_button("やり直", "↪", "やり直し (Ctrl+Y)")
-        self.btn_redo.clicked.connect(self.redo_clicked.emit)
-        edit_group.add_button(self.btn_redo)
-
-        self.addWidget(edit_group)
-        self.addSeparator()
-
-        # === Task Group ===
-        task_group = ToolbarGroup("タスク")
-
-        self.btn_add = _make_button("追加", "➕", "新規タスクを追加 (Insert)")
-        self.btn_add.clicked.connect(self.add_task_clicked.emit)
-        task_group.add_button(self.btn_add)
-
-        self.btn_delete = _make_button("削除", "🗑", "タスクを削除 (Delete)")
-        self.btn_delete.clicked.connect(self.delete_task_clicked.emit)
-        task_group.add_button(self.btn_delete)
-
-        self.btn_info = _make_button("情報", "ℹ", "タスク情報を表示")
-        self.btn_info.clicked.connect(self.task_info_clicked.emit)
-        task_group.add_button(self.btn_info)
-
-        self.btn_milestone = _make_button("MS", "◆", "マイルストーン切替")
-        self.btn_milestone.clicked.connect(self.milestone_clicked.emit)
-        task_group.add_button(self.btn_milestone)
-
-        self.addWidget(task_group)
-        self.addSeparator()
-
-        # === View/Sort Group ===
-        view_group = ToolbarGroup("表示・整列")
-        
-        self.btn_toggle_wbs = _make_button("WBS", "◀▶", "WBS表示切替")
-        self.btn_toggle_wbs.clicked.connect(self.toggle_wbs_clicked.emit)
-        view_group.add_button(self.btn_toggle_wbs)
-        
-        self.btn_sort_wf = _make_button("WF", "🌊", "ウォーターフォール順に並べ替え")
-        self.btn_sort_wf.clicked.connect(self.sort_waterfall_clicked.emit)
-        view_group.add_button(self.btn_sort_wf)
-
-        self.addWidget(view_group)
-        self.addSeparator()
-
-        # === Structure Group ===
-        struct_group = ToolbarGroup("構造")
-
-        self.btn_indent = _make_button("→", "→", "インデント (Tab)")
-        self.btn_indent.clicked.connect(self.indent_clicked.emit)
-        struct_group.add_button(self.btn_indent)
-
-        self.btn_outdent = _make_button("←", "←", "アウトデント (Shift+Tab)")
-        self.btn_outdent.clicked.connect(self.outdent_clicked.emit)
-        struct_group.add_button(self.btn_outdent)
-
-        self.btn_link = _make_button("🔗", "🔗", "タスクをリンク")
-        self.btn_link.clicked.connect(self.link_tasks_clicked.emit)
-        struct_group.add_button(self.btn_link)
-
-        self.btn_unlink = _make_button("✂", "✂", "リンク解除")
-        self.btn_unlink.clicked.connect(self.unlink_tasks_clicked.emit)
-        struct_group.add_button(self.btn_unlink)
-
-        self.addWidget(struct_group)
-        self.addSeparator()
-
-        # === Schedule Group ===
-        sched_group = ToolbarGroup("スケジュール")
-
-        self.btn_baseline = _make_button("基準", "📋", "ベースライン設定")
-        self.btn_baseline.clicked.connect(self.set_baseline_clicked.emit)
-        sched_group.add_button(self.btn_baseline)
-
-        self.btn_today = _make_button("今日", "📅", "今日にスクロール")
-        self.btn_today.clicked.connect(self.scroll_today_clicked.emit)
-        sched_group.add_button(self.btn_today)
-
-        self.addWidget(sched_group)
-        self.addSeparator()
-
-        # === Data Group ===
-        data_group = ToolbarGroup("データ")
-
-        self.btn_export = _make_button("CSV", "📤", "CSVエクスポート")
-        self.btn_export.clicked.connect(self.export_csv_clicked.emit)
-        data_group.add_button(self.btn_export)
-
-        self.btn_export_excel = _make_button("Excel", "📊", "Excel(.xlsx)エクスポート")
-        self.btn_export_excel.clicked.connect(self.export_excel_clicked.emit)
-        data_group.add_button(self.btn_export_excel)
-
-        self.btn_export_pptx = _make_button("PPT", "📽️", "PowerPoint(.pptx)ガントエクスポート")
-        self.btn_export_pptx.clicked.connect(self.export_pptx_clicked.emit)
-        data_group.add_button(self.btn_export_pptx)
-
-        self.btn_import = _make_button("読込", "📥", "CSVインポート")
-        self.btn_import.clicked.connect(self.import_csv_clicked.emit)
-        data_group.add_button(self.btn_import)
-
-        self.addWidget(data_group)
+        # Groups are filled before being added, so this only spares the toolbar's
+        # own repaints between the addWidget calls
+        self.setUpdatesEnabled(False)
+
+        for i, (title, buttons) in enumerate(_TOOLBAR_SPEC):
+            if i:
+                self.addSeparator()
+            group = ToolbarGroup(title)
+            for attr, text, icon_text, tooltip, signal in buttons:
+                btn = _make_button(text, icon_text, tooltip)
+                btn.clicked.connect(getattr(self, signal).emit)
+                setattr(self, attr, btn)
+                group.add_button(btn)
+            self.addWidget(group)
 
         # Spacer
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.addWidget(spacer)
+        self.setUpdatesEnabled(True)
@@ -3,83 +3,145 @@
 import csv
 import json
 import io
-from datetime import date, datetime
+from datetime import date
 
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill
     HAS_OPENPYXL = True
 except ImportError:
     HAS_OPENPYXL = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+_CSV_FIELDNAMES = (
+    "id", "wbs", "name", "duration", "start_date", "end_date",
+    "progress", "predecessors", "resource_names",
+    "is_milestone", "notes"
+)
+
+
+_START_COL = _CSV_FIELDNAMES.index("start_date")
+_END_COL = _CSV_FIELDNAMES.index("end_date")
+
+
+def _csv_row(task: dict) -> list:
+    """Task as a list of CSV field values, with dates as ISO strings."""
+    get = task.get
+    row = [get(key, "") for key in _CSV_FIELDNAMES]
+    start, end = row[_START_COL], row[_END_COL]
+    if isinstance(start, date):
+        row[_START_COL] = start.isoformat()
+    if isinstance(end, date):
+        row[_END_COL] = end.isoformat()
+    return row
+
+
+def _write_tasks_csv(f, tasks: list[dict]) -> None:
+    """Write the header and all task rows to an open text stream."""
+    # A plain csv.writer over lists: DictWriter's per-row generator over the
+    # field names costs about as much again as the C writer itself
+    writer = csv.writer(f)
+    writer.writerow(_CSV_FIELDNAMES)
+    writer.writerows(map(_csv_row, tasks))
+
 
 def tasks_to_csv(tasks: list[dict]) -> str:
     """Export tasks to CSV string."""
     output = io.StringIO()
-    fieldnames = [
-        "id", "wbs", "name", "duration", "start_date", "end_date",
-        "progress", "predecessors", "resource_names",
-        "is_milestone", "notes"
-    ]
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
-    writer.writeheader()
-    for task in tasks:
-        row = dict(task)
-        # Convert dates
-        for key in ("start_date", "end_date"):
-            if isinstance(row.get(key), date):
-                row[key] = row[key].isoformat()
-        writer.writerow(row)
+    _write_tasks_csv(output, tasks)
     return output.getvalue()
 
 
+def tasks_to_csv_file(tasks: list[dict], path, encoding: str = "utf-8-sig") -> None:
+    """Export tasks straight to a CSV file, without building the text in memory.
+
+    The default encoding writes a BOM so Excel detects UTF-8.
+    """
+    with open(path, "w", newline="", encoding=encoding, buffering=1 << 20) as f:
+        _write_tasks_csv(f, tasks)
+
+
+_TRUE_TEXT = frozenset(("true", "1", "yes"))
+
+
+def _parse_csv_date(val: str | None) -> date | None:
+    if not val:
+        return None
+    try:
+        return date.fromisoformat(val)
+    except ValueError:
+        return None
+
+
+def _csv_task(row: dict) -> dict:
+    """Convert one DictReader row into a task in place (each row is a fresh dict)."""
+    get = row.get
+    row["id"] = int(get("id") or 0)
+    row["duration"] = int(get("duration") or 1)
+    row["progress"] = float(get("progress") or 0)
+    row["is_milestone"] = (get("is_milestone") or "").lower() in _TRUE_TEXT
+    row["start_date"] = _parse_csv_date(get("start_date"))
+    row["end_date"] = _parse_csv_date(get("end_date"))
+    return row
+
+
 def csv_to_tasks(csv_text: str) -> list[dict]:
     """Import tasks from CSV string."""
-    reader = csv.DictReader(io.StringIO(csv_text))
-    tasks = []
-    for row in reader:
-        task = dict(row)
-        # Convert types
-        task["id"] = int(task.get("id", 0))
-        task["duration"] = int(task.get("duration", 1))
-        task["progress"] = float(task.get("progress", 0))
-        task["is_milestone"] = task.get("is_milestone", "").lower() == "true"
-
-        for key in ("start_date", "end_date"):
-            val = task.get(key, "")
-            if val:
-                try:
-                    task[key] = date.fromisoformat(val)
-                except ValueError:
-                    task[key] = None
-            else:
-                task[key] = None
-        tasks.append(task)
-    return tasks
+    return list(map(_csv_task, csv.DictReader(io.StringIO(csv_text))))
+
+
+def _json_default(obj):
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
 def project_to_json(project_data: dict) -> str:
-    """Export project data to JSON string."""
-    def default_serializer(obj):
-        if isinstance(obj, date):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    """Export project data to JSON string.
+
+    Uses orjson when it is installed; it writes dates natively (same ISO text)
+    instead of calling back into Python for each one.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(
+            project_data, default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(project_data, default=_json_default, ensure_ascii=False, indent=2)
 
-    return json.dumps(project_data, default=default_serializer, ensure_ascii=False, indent=2)
 
+_TASK_DATE_KEYS = ("start_date", "end_date", "constraint_date",
+                   "baseline_start", "baseline_end")
 
-def json_to_project(json_text: str) -> dict:
-    """Import project data from JSON string."""
-    data = json.loads(json_text)
+
+def json_to_project(json_text: str | bytes) -> dict:
+    """Import project data from a JSON string or UTF-8 bytes."""
+    if HAS_ORJSON:
+        try:
+            data = orjson.loads(json_text)
+        except orjson.JSONDecodeError:
+            # e.g. NaN written by the json.dumps fallback, which orjson rejects
+            data = json.loads(json_text)
+    else:
+        data = json.loads(json_text)
 
     # Convert date strings back
     if "tasks" in data:
+        fromisoformat = date.fromisoformat
         for task in data["tasks"]:
-            for key in ("start_date", "end_date", "constraint_date",
-                        "baseline_start", "baseline_end"):
-                if task.get(key) and isinstance(task[key], str):
+            get = task.get
+            for key in _TASK_DATE_KEYS:
+                val = get(key)
+                if val and type(val) is str:
                     try:
-                        task[key] = date.fromisoformat(task[key])
+                        task[key] = fromisoformat(val)
                     except ValueError:
                         task[key] = None
 
@@ -93,50 +155,72 @@ def json_to_project(json_text: str) -> dict:
     return data
 
 
-def export_tasks_to_excel(tasks: list[dict], filepath: str) -> bool:
+def export_tasks_to_excel(tasks: list[dict], filepath: str,
+                          segment_size: int | None = None) -> bool:
     """Export tasks to an Excel file (.xlsx) using openpyxl.
     Returns True if successful, False if openpyxl is not available.
+
+    Uses openpyxl's write-only mode so rows are streamed to disk instead of
+    being held as a full cell grid in memory. With segment_size, tasks are
+    split across sheets "Tasks_1", "Tasks_2", ... of at most that many rows.
     """
     if not HAS_OPENPYXL:
         return False
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Tasks"
+    wb = openpyxl.Workbook(write_only=True)
 
-    # Define columns
-    columns = [
-        "id", "wbs", "name", "duration", "start_date", "end_date",
-        "progress", "predecessors", "resource_names",
-        "is_milestone", "notes"
-    ]
+    if segment_size and segment_size > 0 and len(tasks) > segment_size:
+        for i, offset in enumerate(range(0, len(tasks), segment_size), 1):
+            ws = wb.create_sheet(f"Tasks_{i}")
+            _write_task_sheet(ws, tasks[offset:offset + segment_size])
+    else:
+        _write_task_sheet(wb.create_sheet("Tasks"), tasks)
 
-    # Write Header
-    for col_idx, col_name in enumerate(columns, 1):
-        cell = ws.cell(row=1, column=col_idx, value=col_name)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-
-    # Write Data
-    for row_idx, task in enumerate(tasks, 2):
-        for col_idx, col_name in enumerate(columns, 1):
-            val = task.get(col_name, "")
-            # Convert dates to strings or excel date format
-            if isinstance(val, date) or isinstance(val, datetime):
-                # openpyxl can handle datetimes automatically if desired
-                val = val.isoformat()
-            elif isinstance(val, bool):
-                val = "True" if val else "False"
-                
-            ws.cell(row=row_idx, column=col_idx, value=val)
-
-    # Auto-adjust column widths roughly
+    wb.save(filepath)
+    return True
+
+
+_EXCEL_COLUMNS = (
+    "id", "wbs", "name", "duration", "start_date", "end_date",
+    "progress", "predecessors", "resource_names",
+    "is_milestone", "notes"
+)
+
+
+def _excel_value(val):
+    """Cell value for a task field: dates as ISO text, bools as "True"/"False"."""
+    if isinstance(val, date):  # datetime included
+        return val.isoformat()
+    if isinstance(val, bool):
+        return "True" if val else "False"
+    return val
+
+
+def _write_task_sheet(ws, tasks: list[dict]) -> None:
+    """Write the header and task rows to a write-only worksheet."""
+    columns = _EXCEL_COLUMNS
+
+    # Column widths must be set before any row is written
     for col_idx, col_name in enumerate(columns, 1):
         letter = openpyxl.utils.get_column_letter(col_idx)
         ws.column_dimensions[letter].width = max(10, len(col_name) + 2)
-        
+
     # Name column gets a bit more space
     ws.column_dimensions['C'].width = 30
-    
-    wb.save(filepath)
-    return True
+
+    # Write Header
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+    header = []
+    for col_name in columns:
+        cell = WriteOnlyCell(ws, value=col_name)
+        cell.font = header_font
+        cell.fill = header_fill
+        header.append(cell)
+    ws.append(header)
+
+    # Write Data: one list per row, appended in a single call
+    append = ws.append
+    for task in tasks:
+        get = task.get
+        append([_excel_value(get(col_name, "")) for col_name in columns])
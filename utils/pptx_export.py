@@ -1,20 +1,122 @@
 """PowerPoint Export - Render Gantt chart to a single PowerPoint slide."""
 
+import re
+from collections import Counter
 from datetime import date, timedelta
+from xml.sax.saxutils import escape
+
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
 
 # Slide dimensions (widescreen 16:9)
 SLIDE_WIDTH = Inches(13.333)
 SLIDE_HEIGHT = Inches(7.5)
 
+# Colors
+BG_COLOR = RGBColor(0x1A, 0x1B, 0x2E)
+HEADER_BG = RGBColor(0x22, 0x23, 0x3C)
+BAR_COLOR = RGBColor(0x6C, 0x63, 0xFF)
+BAR_PROGRESS = RGBColor(0x4E, 0xC9, 0xB0)
+CRITICAL_COLOR = RGBColor(0xFF, 0x6B, 0x6B)
+MILESTONE_COLOR = RGBColor(0xFF, 0xD9, 0x3D)
+SUMMARY_COLOR = RGBColor(0x9D, 0x8C, 0xEF)
+TEXT_COLOR = RGBColor(0xE0, 0xE0, 0xF0)
+TODAY_COLOR = RGBColor(0xFF, 0x44, 0x44)
+
+# Shape XML matching what python-pptx's add_shape/add_textbox plus the fill, line
+# and font setters produce. Chart shapes are emitted as strings and parsed in one
+# go, instead of paying python-pptx's per-shape proxy and max-id scan.
+_AUTOSHAPE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name} {idx}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>'
+    '{fill}</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody>{body}</p:txBody></p:sp>'
+)
+# Solid fill + no outline fragment per colour, shared by every shape of that colour
+_FILL_XML: dict[str, str] = {}
+_EMPTY_BODY = '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p>'
+_LABEL_BODY = (
+    '<a:bodyPr rtlCol="0" anchor="ctr" wrap="none"/><a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr"><a:defRPr sz="{sz}"><a:solidFill><a:srgbClr val="{color}"/>'
+    '</a:solidFill></a:defRPr></a:pPr>{runs}</a:p>'
+)
+_TEXTBOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {idx}"/><p:cNvSpPr txBox="1"/><p:nvPr/>'
+    '</p:nvSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p><a:pPr><a:defRPr sz="{sz}"{bold}><a:solidFill><a:srgbClr val="{color}"/>'
+    '</a:solidFill></a:defRPr></a:pPr>{runs}</a:p></p:txBody></p:sp>'
+)
+_LINE_BREAK = re.compile("\n|\v")
+_CTRL_CHAR = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+def _runs_xml(text: str) -> str:
+    """Runs and line breaks for paragraph text, as python-pptx's _Paragraph.text writes them."""
+    parts = []
+    for idx, r_str in enumerate(_LINE_BREAK.split(text)):
+        if idx > 0:
+            parts.append("<a:br/>")
+        if r_str:
+            r_str = _CTRL_CHAR.sub(lambda m: "_x%04X_" % ord(m.group(1)), r_str)
+            parts.append(f"<a:r><a:t>{escape(r_str)}</a:t></a:r>")
+    return "".join(parts)
+
+
+class _ShapeBatch:
+    """Collects shape XML for a slide and appends it to the shape tree in one parse."""
+
+    def __init__(self, slide, first_id: int):
+        self._slide = slide
+        self._next_id = first_id
+        self._parts: list[str] = []
+
+    def _take_id(self) -> int:
+        shape_id = self._next_id
+        self._next_id += 1
+        return shape_id
+
+    def add_shape(self, prst: str, x, y, cx, cy, fill: RGBColor, body: str = _EMPTY_BODY):
+        shape_id = self._take_id()
+        fill_xml = _FILL_XML.get(fill)
+        if fill_xml is None:
+            fill_xml = _FILL_XML[fill] = (
+                f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill><a:ln><a:noFill/></a:ln>'
+            )
+        self._parts.append(_AUTOSHAPE_XML.format(
+            id=shape_id, name="Diamond" if prst == "diamond" else "Rectangle", idx=shape_id - 1,
+            x=int(x), y=int(y), cx=int(cx), cy=int(cy), prst=prst, fill=fill_xml, body=body,
+        ))
+
+    def add_textbox(self, x, y, cx, cy, text: str, size: Pt, color: RGBColor, bold=False):
+        shape_id = self._take_id()
+        self._parts.append(_TEXTBOX_XML.format(
+            id=shape_id, idx=shape_id - 1, x=int(x), y=int(y), cx=int(cx), cy=int(cy),
+            sz=size.centipoints, bold=' b="1"' if bold else "", color=color,
+            runs=_runs_xml(text),
+        ))
+
+    def flush(self):
+        if self._parts:
+            container = parse_xml(f'<p:spTree {nsdecls("a", "p")}>{"".join(self._parts)}</p:spTree>')
+            self._slide.shapes._spTree.extend(list(container))
+            self._parts.clear()
+
 
 def export_gantt_to_pptx(tasks: list[dict], dependencies: list[dict],
                           filepath: str, project_name: str = ""):
     """Export Gantt chart to a single PowerPoint slide."""
+    today = date.today()
     prs = Presentation()
     prs.slide_width = SLIDE_WIDTH
     prs.slide_height = SLIDE_HEIGHT
@@ -22,16 +124,24 @@ def export_gantt_to_pptx(tasks: list[dict], dependencies: list[dict],
     slide_layout = prs.slide_layouts[6]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
 
-    # Calculate date range
-    all_starts = [t["start_date"] for t in tasks if isinstance(t.get("start_date"), date)]
-    all_ends = [t["end_date"] for t in tasks if isinstance(t.get("end_date"), date)]
-    if not all_starts or not all_ends:
+    # Calculate date range in one pass over the tasks
+    first_start = last_end = None
+    for t in tasks:
+        start = t.get("start_date")
+        end = t.get("end_date")
+        if isinstance(start, date) and (first_start is None or start < first_start):
+            first_start = start
+        if isinstance(end, date) and (last_end is None or end > last_end):
+            last_end = end
+    if first_start is None or last_end is None:
         prs.save(filepath)
         return
 
-    proj_start = min(all_starts) - timedelta(days=1)
-    proj_end = max(all_ends) + timedelta(days=3)
+    proj_start = first_start - timedelta(days=1)
+    proj_end = last_end + timedelta(days=3)
     total_days = (proj_end - proj_start).days
+    # Day offsets as plain int ordinal differences, without timedelta objects
+    start_ord = proj_start.toordinal()
 
     # Layout constants
     left_margin = Inches(0.3)
@@ -48,38 +158,32 @@ def export_gantt_to_pptx(tasks: list[dict], dependencies: list[dict],
 
     display_tasks = tasks
     if len(display_tasks) > max_target_rows:
-        max_level = max((t.get("wbs_level", 0) for t in display_tasks), default=0)
-        for level_limit in range(max_level - 1, -1, -1):
-            filtered = [t for t in display_tasks if t.get("wbs_level", 0) <= level_limit]
-            if len(filtered) <= max_target_rows:
-                display_tasks = filtered
+        # Deepest level limit whose row count fits, found from a level histogram
+        levels = [t.get("wbs_level", 0) for t in tasks]
+        per_level = Counter(levels)
+        shown = len(levels)
+        for level_limit in range(max(levels) - 1, -1, -1):
+            shown -= per_level[level_limit + 1]
+            if shown <= max_target_rows:
+                display_tasks = [t for t, lv in zip(tasks, levels) if lv <= level_limit]
                 break
         else:
-            display_tasks = [t for t in display_tasks if t.get("wbs_level", 0) == 0]
+            display_tasks = [t for t, lv in zip(tasks, levels) if lv == 0]
 
     if len(display_tasks) > 0:
         row_height = min(Inches(0.35), available_height / len(display_tasks))
     else:
         row_height = Inches(0.28)
+    # Height of the header plus all task rows, for full-height overlays
+    chart_area_h = header_height + len(display_tasks) * row_height
 
     day_width = chart_width / total_days if total_days > 0 else Inches(0.1)
 
-    # Colors
-    bg_color = RGBColor(0x1A, 0x1B, 0x2E)
-    header_bg = RGBColor(0x22, 0x23, 0x3C)
-    bar_color = RGBColor(0x6C, 0x63, 0xFF)
-    bar_progress = RGBColor(0x4E, 0xC9, 0xB0)
-    critical_color = RGBColor(0xFF, 0x6B, 0x6B)
-    milestone_color = RGBColor(0xFF, 0xD9, 0x3D)
-    summary_color = RGBColor(0x9D, 0x8C, 0xEF)
-    text_color = RGBColor(0xE0, 0xE0, 0xF0)
-    grid_color = RGBColor(0x2D, 0x2E, 0x4A)
-
     # Slide background
     background = slide.background
     fill = background.fill
     fill.solid()
-    fill.fore_color.rgb = bg_color
+    fill.fore_color.rgb = BG_COLOR
 
     # Title
     txBox = slide.shapes.add_textbox(left_margin, Inches(0.2), Inches(8), Inches(0.6))
@@ -88,40 +192,25 @@ def export_gantt_to_pptx(tasks: list[dict], dependencies: list[dict],
     p.text = project_name or "プロジェクトスケジュール"
     p.font.size = Pt(22)
     p.font.bold = True
-    p.font.color.rgb = text_color
-
-    # Month headers
-    current_month = None
-    for day_idx in range(total_days):
-        d = proj_start + timedelta(days=day_idx)
-        if d.month != current_month:
-            current_month = d.month
-            x = chart_left + day_width * day_idx
-            # Find how many days until next month
-            remaining = 0
-            for j in range(day_idx, total_days):
-                dj = proj_start + timedelta(days=j)
-                if dj.month != current_month:
-                    break
-                remaining += 1
-            w = day_width * remaining
-            month_names = ["", "1月", "2月", "3月", "4月", "5月", "6月",
-                           "7月", "8月", "9月", "10月", "11月", "12月"]
-            label = f"{d.year}年{month_names[d.month]}"
-
-            shape = slide.shapes.add_shape(
-                1, x, top_margin, w, header_height  # MSO_SHAPE.RECTANGLE = 1
-            )
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = header_bg
-            shape.line.fill.background()
-            tf = shape.text_frame
-            tf.word_wrap = False
-            p = tf.paragraphs[0]
-            p.text = label
-            p.font.size = Pt(8)
-            p.font.color.rgb = text_color
-            p.alignment = PP_ALIGN.CENTER
+    p.font.color.rgb = TEXT_COLOR
+
+    shapes = _ShapeBatch(slide, txBox.shape_id + 1)
+
+    # Month headers: one segment per calendar month, clipped to the chart range
+    label_size = Pt(8).centipoints
+    day_idx = 0
+    d = proj_start
+    while day_idx < total_days:
+        next_month = date(d.year + d.month // 12, d.month % 12 + 1, 1)
+        remaining = min((next_month - d).days, total_days - day_idx)
+        x = chart_left + day_width * day_idx
+        w = day_width * remaining
+        label = f"{d.year}年{d.month}月"
+
+        body = _LABEL_BODY.format(sz=label_size, color=TEXT_COLOR, runs=_runs_xml(label))
+        shapes.add_shape("rect", x, top_margin, w, header_height, HEADER_BG, body)
+        day_idx += remaining
+        d = next_month
 
     # Task rows
     base_font_size = Pt(8) if row_height >= Inches(0.25) else Pt(6)
@@ -131,22 +220,14 @@ def export_gantt_to_pptx(tasks: list[dict], dependencies: list[dict],
         indent = "    " * wbs_level
 
         # Task name
-        name_shape = slide.shapes.add_textbox(
-            left_margin, y, name_col_width, row_height
-        )
-        tf = name_shape.text_frame
-        tf.word_wrap = False
-        p = tf.paragraphs[0]
         name_text = indent + task.get("name", "")
-        p.text = name_text
-        p.font.size = base_font_size
         if task.get("is_summary"):
-            p.font.bold = True
-            p.font.color.rgb = summary_color
-        elif task.get("is_critical"):
-            p.font.color.rgb = critical_color
+            shapes.add_textbox(left_margin, y, name_col_width, row_height, name_text,
+                               base_font_size, SUMMARY_COLOR, bold=True)
         else:
-            p.font.color.rgb = text_color
+            shapes.add_textbox(left_margin, y, name_col_width, row_height, name_text,
+                               base_font_size,
+                               CRITICAL_COLOR if task.get("is_critical") else TEXT_COLOR)
 
         # Task bar
         start = task.get("start_date")
@@ -154,56 +235,35 @@ def export_gantt_to_pptx(tasks: list[dict], dependencies: list[dict],
         if not isinstance(start, date) or not isinstance(end, date):
             continue
 
-        bar_x = chart_left + day_width * (start - proj_start).days
-        bar_w = max(Emu(10000), day_width * (end - start).days)
+        start_day = start.toordinal()
+        bar_x = chart_left + day_width * (start_day - start_ord)
+        bar_w = max(Emu(10000), day_width * (end.toordinal() - start_day))
         bar_h = row_height * 0.5
         bar_y = y + (row_height - bar_h) / 2
 
         if task.get("is_milestone"):
             # Diamond
             size = row_height * 0.5
-            ms = slide.shapes.add_shape(
-                4, bar_x - size / 2, bar_y, size, size  # MSO_SHAPE.DIAMOND = 4
-            )
-            ms.fill.solid()
-            ms.fill.fore_color.rgb = milestone_color
-            ms.line.fill.background()
+            shapes.add_shape("diamond", bar_x - size / 2, bar_y, size, size, MILESTONE_COLOR)
         elif task.get("is_summary"):
             # Summary bar
-            shape = slide.shapes.add_shape(1, bar_x, bar_y, bar_w, bar_h * 0.5)
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = summary_color
-            shape.line.fill.background()
+            shapes.add_shape("rect", bar_x, bar_y, bar_w, bar_h * 0.5, SUMMARY_COLOR)
         else:
             # Normal bar background
-            shape = slide.shapes.add_shape(1, bar_x, bar_y, bar_w, bar_h)
-            shape.fill.solid()
-            color = critical_color if task.get("is_critical") else bar_color
-            shape.fill.fore_color.rgb = color
-            shape.line.fill.background()
+            color = CRITICAL_COLOR if task.get("is_critical") else BAR_COLOR
+            shapes.add_shape("rect", bar_x, bar_y, bar_w, bar_h, color)
 
             # Progress fill
             progress = task.get("progress", 0)
             if progress and progress > 0:
                 prog_w = int(bar_w * progress / 100)
                 if prog_w > 0:
-                    pshape = slide.shapes.add_shape(
-                        1, bar_x, bar_y, prog_w, bar_h
-                    )
-                    pshape.fill.solid()
-                    pshape.fill.fore_color.rgb = bar_progress
-                    pshape.line.fill.background()
+                    shapes.add_shape("rect", bar_x, bar_y, prog_w, bar_h, BAR_PROGRESS)
 
     # Today line
-    today = date.today()
     if proj_start <= today <= proj_end:
-        today_x = chart_left + day_width * (today - proj_start).days
-        line = slide.shapes.add_shape(
-            1, today_x, top_margin, Emu(15000),
-            header_height + len(display_tasks) * row_height
-        )
-        line.fill.solid()
-        line.fill.fore_color.rgb = RGBColor(0xFF, 0x44, 0x44)
-        line.line.fill.background()
+        today_x = chart_left + day_width * (today.toordinal() - start_ord)
+        shapes.add_shape("rect", today_x, top_margin, Emu(15000), chart_area_h, TODAY_COLOR)
 
+    shapes.flush()
     prs.save(filepath)